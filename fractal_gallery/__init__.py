@@ -0,0 +1,10 @@
+"""
+Fractal Gallery
+===============
+
+Paquete con los generadores de fractales, la configuración y la gestión
+de archivos. Los submódulos no se importan aquí: cargar numpy, matplotlib
+y numba tiene un coste notable, así que cada comando importa solo lo que
+necesita (por ejemplo ``from fractal_gallery.mandelbrot import
+MandelbrotGenerator``).
+"""
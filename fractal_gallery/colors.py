@@ -0,0 +1,70 @@
+"""
+Coloreado de Matrices de Fractales
+==================================
+
+Tablas de colores, coloreado por LUT y escala de color de las matrices
+generadas. Solo depende de numpy (matplotlib se importa al construir una
+tabla), de modo que tanto los generadores como la gestión de archivos
+pueden usarlo sin cargar numba ni pyplot.
+"""
+
+import functools
+from typing import Any, Dict
+
+import numpy as np
+
+
+# Nivel máximo de la salida con coloreado suave (uint8); se reserva para
+# los puntos que no escapan
+SMOOTH_LEVELS = 255
+
+
+def color_limit(params: Dict[str, Any]) -> int:
+    """
+    Valor de la matriz que corresponde al extremo superior del mapa de colores.
+    
+    Es ``max_iter`` para las iteraciones enteras y ``SMOOTH_LEVELS`` cuando
+    el fractal se generó con coloreado suave.
+    """
+    return SMOOTH_LEVELS if params.get('smooth') else params.get('max_iter', 100)
+
+
+def colorbar_label(params: Dict[str, Any]) -> str:
+    """Etiqueta de la barra de colores según el tipo de valores de la matriz."""
+    return 'Nivel de coloreado suave' if params.get('smooth') else 'Iteraciones hasta escape'
+
+
+@functools.lru_cache(maxsize=32)
+def colormap_lut(colormap: str, size: int) -> np.ndarray:
+    """
+    Tabla de colores RGBA con ``size`` entradas, empaquetada en ``uint32``.
+    
+    Cada entrada ocupa 4 bytes (R, G, B, A), de modo que colorear una imagen
+    es un único ``np.take`` de enteros de 32 bits en lugar de una gather de
+    filas de 4 bytes.
+    """
+    import matplotlib
+    rgba = matplotlib.colormaps[colormap](np.linspace(0.0, 1.0, size), bytes=True)
+    return np.ascontiguousarray(rgba).view(np.uint32).ravel()
+
+
+def colorize(fractal_data: np.ndarray, colormap: str, max_iter: int) -> np.ndarray:
+    """
+    Aplica un mapa de colores a una matriz de iteraciones mediante una LUT.
+    
+    La tabla se calcula una sola vez por (mapa de colores, max_iter) y se
+    normaliza sobre [0, max_iter], así que el mismo número de iteraciones
+    produce siempre el mismo color entre imágenes.
+    
+    Args:
+        fractal_data: Matriz 2D de iteraciones
+        colormap: Nombre del mapa de colores de matplotlib
+        max_iter: Iteraciones máximas usadas al generar los datos
+    
+    Returns:
+        Matriz (alto, ancho, 4) de tipo uint8 con los colores RGBA
+    """
+    lut = colormap_lut(colormap, max_iter + 1)
+    # mode='clip' acota los índices fuera de rango sin crear una copia previa
+    packed = np.take(lut, fractal_data, mode='clip')
+    return packed.view(np.uint8).reshape(fractal_data.shape + (4,))
@@ -9,9 +9,42 @@ esquemas de colores, y parámetros de renderizado.
 
 import yaml
 import os
-from typing import Dict, Any, List, Optional, Tuple
+import json
+import glob
+from typing import Dict, Any, Mapping, Optional, Tuple
 from pathlib import Path
 import datetime
+import functools
+from types import MappingProxyType
+
+
+# Cargador de libyaml (C) si está disponible; mismo resultado que SafeLoader
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=1)
+def _locate_config() -> str:
+    """
+    Busca el archivo de configuración en ubicaciones estándar.
+    
+    La búsqueda se hace una sola vez por proceso, aunque se creen varias
+    instancias de ``FractalConfig``; se devuelve la ruta absoluta para que
+    siga siendo válida si después cambia el directorio de trabajo.
+    """
+    possible_paths = [
+        "config/fractal_config.yaml",
+        "../config/fractal_config.yaml",
+        os.path.join(os.path.dirname(__file__), "../config/fractal_config.yaml")
+    ]
+    
+    for path in possible_paths:
+        try:
+            os.stat(path)
+            return os.path.abspath(path)
+        except OSError:
+            continue
+    
+    raise FileNotFoundError("No se encontró archivo de configuración fractal_config.yaml")
 
 
 class FractalConfig:
@@ -32,34 +65,57 @@ class FractalConfig:
         Args:
             config_path: Ruta al archivo de configuración YAML
         """
-        self.config_path = config_path or self._find_config_file()
+        self.config_path = config_path or _locate_config()
         self.config = self._load_config()
+        self._index_config()
         
-    def _find_config_file(self) -> str:
-        """Busca el archivo de configuración en ubicaciones estándar."""
-        possible_paths = [
-            "config/fractal_config.yaml",
-            "../config/fractal_config.yaml",
-            os.path.join(os.path.dirname(__file__), "../config/fractal_config.yaml")
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-        
-        raise FileNotFoundError("No se encontró archivo de configuración fractal_config.yaml")
-    
     def _load_config(self) -> Dict[str, Any]:
-        """Carga la configuración desde el archivo YAML."""
+        """
+        Carga la configuración desde el archivo YAML.
+        
+        El resultado se guarda junto al YAML como JSON, con la fecha de
+        modificación en el nombre: mientras el YAML no cambie, las siguientes
+        ejecuciones leen el JSON, bastante más rápido de analizar.
+        """
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-                print(f"✅ Configuración cargada desde: {self.config_path}")
-                return config
+            cache_path = f"{self.config_path}.{os.stat(self.config_path).st_mtime_ns}.json"
+            config = self._read_config_cache(cache_path)
+            
+            if config is None:
+                with open(self.config_path, 'r', encoding='utf-8') as file:
+                    config = yaml.load(file, Loader=_YAML_LOADER)
+                self._write_config_cache(cache_path, config)
+            
+            print(f"✅ Configuración cargada desde: {self.config_path}")
+            return config
         except Exception as e:
             print(f"❌ Error cargando configuración: {e}")
             return self._get_default_config()
     
+    def _read_config_cache(self, cache_path: str) -> Optional[Dict[str, Any]]:
+        """Lee la caché JSON de la configuración, o None si no es válida."""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_config_cache(self, cache_path: str, config: Dict[str, Any]):
+        """Guarda la caché JSON y elimina las de versiones anteriores del YAML."""
+        for stale in glob.glob(f"{glob.escape(self.config_path)}.*.json"):
+            if stale != cache_path:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+        
+        # La caché es opcional: un directorio de solo lectura no es un error
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as file:
+                json.dump(config, file)
+        except (OSError, TypeError):
+            pass
+    
     def _get_default_config(self) -> Dict[str, Any]:
         """Configuración mínima por defecto si no se puede cargar el archivo."""
         return {
@@ -86,7 +142,43 @@ class FractalConfig:
             }
         }
     
-    def get_quality_preset(self, preset_name: str) -> Dict[str, Any]:
+    def _index_config(self):
+        """
+        Extrae una sola vez las secciones consultadas con frecuencia.
+        
+        La configuración no cambia tras la carga, así que las búsquedas
+        posteriores son accesos directos a diccionario en lugar de recorrer
+        ``self.config`` anidado en cada llamada.
+        """
+        # Vistas de solo lectura: se devuelven sin copiar en cada consulta
+        self._presets = {name: MappingProxyType(preset) for name, preset
+                         in self.config.get('quality_presets', {}).items()}
+        self._colormaps = {category: tuple(maps) for category, maps
+                           in self.config.get('colormaps', {}).items()}
+        self._interesting_points = self.config.get('exploration', {}).get('interesting_points', {})
+        self._rendering = MappingProxyType(self.config.get('rendering', {}))
+        
+        output_config = self.config.get('output', {})
+        self._filename_template = output_config.get('filename_template', '{type}_{preset}_{timestamp}')
+        self._timestamp_format = output_config.get('timestamp_format', '%Y%m%d_%H%M%S')
+        self._default_extension = '.' + self._rendering.get('image_format', 'png').lstrip('.')
+        
+        # Límites de validación
+        algorithms = self.config.get('algorithms', {})
+        cli_config = self.config.get('cli', {})
+        self._max_iter_limit = algorithms.get('max_iterations_limit', 1000)
+        self._max_res_limit = algorithms.get('max_resolution_limit', 8192)
+        self._warn_on_high_memory = cli_config.get('warn_on_high_memory', True)
+        self._memory_threshold = cli_config.get('memory_warning_threshold', 1000000000)
+        
+        self._preset_names = tuple(self._presets.keys())
+        # dict.fromkeys elimina duplicados conservando el orden de la configuración
+        self._all_colormaps = tuple(dict.fromkeys(name for category_maps in self._colormaps.values()
+                                                  for name in category_maps))
+        self._point_names = MappingProxyType({ftype: tuple(points_dict.keys())
+                                              for ftype, points_dict in self._interesting_points.items()})
+    
+    def get_quality_preset(self, preset_name: str) -> Mapping[str, Any]:
         """
         Obtiene los parámetros para un preset de calidad específico.
         
@@ -94,18 +186,19 @@ class FractalConfig:
             preset_name: Nombre del preset (preview, standard, high, ultra, print)
             
         Returns:
-            Diccionario con parámetros de renderizado
+            Vista de solo lectura con los parámetros de renderizado
+            (usar ``dict(...)`` si se necesita una copia modificable)
         """
-        presets = self.config.get('quality_presets', {})
+        presets = self._presets
         
         if preset_name not in presets:
-            available = list(presets.keys())
+            available = list(self._preset_names)
             raise ValueError(f"Preset '{preset_name}' no encontrado. "
                            f"Disponibles: {available}")
         
-        return presets[preset_name].copy()
+        return presets[preset_name]
     
-    def get_colormap_category(self, category: str) -> List[str]:
+    def get_colormap_category(self, category: str) -> Tuple[str, ...]:
         """
         Obtiene lista de colormaps para una categoría específica.
         
@@ -113,23 +206,20 @@ class FractalConfig:
             category: Categoría de colormap (warm, cool, artistic, classic)
             
         Returns:
-            Lista de nombres de colormaps
+            Tupla con los nombres de colormaps
         """
-        colormaps = self.config.get('colormaps', {})
+        colormaps = self._colormaps
         
         if category not in colormaps:
             available = list(colormaps.keys())
             raise ValueError(f"Categoría '{category}' no encontrada. "
                            f"Disponibles: {available}")
         
-        return colormaps[category].copy()
+        return colormaps[category]
     
-    def get_all_colormaps(self) -> List[str]:
-        """Obtiene todos los colormaps disponibles en una lista plana."""
-        all_maps = []
-        for category_maps in self.config.get('colormaps', {}).values():
-            all_maps.extend(category_maps)
-        return list(set(all_maps))  # Eliminar duplicados
+    def get_all_colormaps(self) -> Tuple[str, ...]:
+        """Obtiene todos los colormaps disponibles (sin duplicados)."""
+        return self._all_colormaps
     
     def get_interesting_point(self, fractal_type: str, point_name: str) -> Tuple[float, float]:
         """
@@ -142,7 +232,7 @@ class FractalConfig:
         Returns:
             Tupla (x, y) con las coordenadas
         """
-        points = self.config.get('exploration', {}).get('interesting_points', {})
+        points = self._interesting_points
         
         if fractal_type not in points:
             available_types = list(points.keys())
@@ -171,23 +261,16 @@ class FractalConfig:
         Returns:
             Nombre de archivo generado
         """
-        output_config = self.config.get('output', {})
-        template = output_config.get('filename_template', '{type}_{preset}_{timestamp}')
-        timestamp_format = output_config.get('timestamp_format', '%Y%m%d_%H%M%S')
-        
-        # Generar timestamp
-        timestamp = datetime.datetime.now().strftime(timestamp_format)
-        
-        # Aplicar template
-        filename = template.format(
-            type=fractal_type,
-            preset=preset,
-            timestamp=timestamp
-        )
+        # Generar timestamp y aplicar template
+        filename = self._filename_template.format_map({
+            'type': fractal_type,
+            'preset': preset,
+            'timestamp': datetime.datetime.now().strftime(self._timestamp_format)
+        })
         
         # Agregar extensión
         if extension is None:
-            extension = self.config.get('rendering', {}).get('image_format', 'png')
+            return filename + self._default_extension
         
         if not extension.startswith('.'):
             extension = '.' + extension
@@ -242,16 +325,14 @@ class FractalConfig:
         Raises:
             ValueError: Si algún parámetro está fuera de límites
         """
-        algorithms = self.config.get('algorithms', {})
-        
         # Validar límites de iteraciones
-        max_iter_limit = algorithms.get('max_iterations_limit', 1000)
+        max_iter_limit = self._max_iter_limit
         if params.get('max_iter', 0) > max_iter_limit:
             raise ValueError(f"max_iter ({params['max_iter']}) excede el límite "
                            f"de {max_iter_limit}")
         
         # Validar límites de resolución
-        max_res_limit = algorithms.get('max_resolution_limit', 8192)
+        max_res_limit = self._max_res_limit
         width = params.get('width', 0)
         height = params.get('height', 0)
         
@@ -260,30 +341,26 @@ class FractalConfig:
                            f"de {max_res_limit}px")
         
         # Advertir sobre uso alto de memoria
-        cli_config = self.config.get('cli', {})
-        if cli_config.get('warn_on_high_memory', True):
-            memory_threshold = cli_config.get('memory_warning_threshold', 1000000000)
+        if self._warn_on_high_memory:
             estimated_memory = width * height * 4 * 2  # Aproximación conservadora
             
-            if estimated_memory > memory_threshold:
+            if estimated_memory > self._memory_threshold:
                 memory_gb = estimated_memory / (1024**3)
                 print(f"⚠️  Advertencia: Uso estimado de memoria: {memory_gb:.1f} GB")
         
         return True
     
-    def get_rendering_defaults(self) -> Dict[str, Any]:
-        """Obtiene los valores por defecto para renderizado."""
-        return self.config.get('rendering', {}).copy()
+    def get_rendering_defaults(self) -> Mapping[str, Any]:
+        """Obtiene los valores por defecto para renderizado (solo lectura)."""
+        return self._rendering
     
-    def list_available_presets(self) -> List[str]:
+    def list_available_presets(self) -> Tuple[str, ...]:
         """Lista todos los presets de calidad disponibles."""
-        return list(self.config.get('quality_presets', {}).keys())
+        return self._preset_names
     
-    def list_interesting_points(self) -> Dict[str, List[str]]:
-        """Lista todos los puntos interesantes organizados por tipo."""
-        points = self.config.get('exploration', {}).get('interesting_points', {})
-        return {ftype: list(points_dict.keys()) 
-                for ftype, points_dict in points.items()}
+    def list_interesting_points(self) -> Mapping[str, Tuple[str, ...]]:
+        """Lista todos los puntos interesantes organizados por tipo (solo lectura)."""
+        return self._point_names
 
 
 # Ejemplo de uso
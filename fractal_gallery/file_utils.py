@@ -0,0 +1,694 @@
+"""
+Utilidades de Guardado y Gestión de Archivos
+==========================================
+
+Este módulo proporciona funciones para guardar, organizar y gestionar
+las imágenes generadas por el generador de fractales, incluyendo
+metadatos, thumbnails y organización automática.
+"""
+
+import os
+import time
+import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple
+import numpy as np
+import hashlib
+import functools
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+from .colors import colorize, color_limit, colorbar_label
+
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# Subdirectorios que se crean dentro del directorio de salida
+OUTPUT_SUBDIRS = ('mandelbrot', 'julia', 'thumbnails', 'metadata', 'gallery')
+
+# A partir de cuántos metadatos sin caché merece la pena analizarlos en hilos
+PARALLEL_METADATA_MIN = 32
+
+# matplotlib, PIL y yaml se importan dentro de las funciones que los usan:
+# consultar estadísticas o listar imágenes no debe pagar su tiempo de carga
+
+
+def list_image_entries(directories):
+    """
+    Lista las imágenes de varios directorios con una sola pasada por cada uno.
+    
+    Devuelve objetos ``os.DirEntry``: su ``stat()`` reutiliza la información
+    obtenida al leer el directorio, así que ordenar por fecha no requiere
+    una llamada al sistema adicional por archivo.
+    
+    Args:
+        directories: Directorios donde buscar (los inexistentes se ignoran)
+        
+    Yields:
+        Entradas de archivos con extensión .png, .jpg o .jpeg
+    """
+    for directory in directories:
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                        yield entry
+        except FileNotFoundError:
+            continue
+
+
+@functools.lru_cache(maxsize=1)
+def _timestamp(second: int) -> str:
+    """
+    Marca de tiempo ``%Y%m%d_%H%M%S`` para un instante en segundos.
+    
+    Se llama con ``int(time.time())``: todos los archivos guardados dentro
+    del mismo segundo reutilizan la cadena ya formateada.
+    """
+    return datetime.datetime.fromtimestamp(second).strftime("%Y%m%d_%H%M%S")
+
+
+def _parse_metadata_file(metadata_path: Path) -> Dict[str, Any]:
+    """Analiza un archivo de metadatos YAML (vacío si no existe o no es válido)."""
+    # Versión de libyaml (C) si está disponible; mismo resultado
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    
+    try:
+        with open(metadata_path, 'r', encoding='utf-8') as f:
+            return yaml.load(f, Loader=loader) or {}
+    except (OSError, yaml.YAMLError):
+        return {}
+
+
+class FractalFileManager:
+    """
+    Administrador de archivos para imágenes de fractales generadas.
+    
+    Características:
+    - Guardado con metadatos completos
+    - Generación automática de thumbnails
+    - Organización por fecha y tipo
+    - Prevención de duplicados
+    - Gestión de galería
+    """
+    
+    def __init__(self, base_output_dir: str = "output"):
+        """
+        Inicializa el administrador de archivos.
+        
+        Args:
+            base_output_dir: Directorio base donde guardar archivos
+        """
+        self.base_output_dir = Path(base_output_dir)
+        self.ensure_directories()
+        
+        # Metadatos ya analizados: ruta -> (st_mtime_ns, dict). Se carga del
+        # disco la primera vez que se necesita
+        self._metadata_cache_path = self.base_output_dir / ".metadata_cache.pkl"
+        self._metadata_cache: Optional[Dict[str, Tuple[int, Dict[str, Any]]]] = None
+        self._metadata_cache_dirty = False
+        
+        # Estadísticas de almacenamiento: (huella de mtimes, resultado)
+        self._stats_cache: Optional[Tuple[Tuple[int, ...], Dict[str, Any]]] = None
+    
+    def ensure_directories(self):
+        """
+        Crea la estructura de directorios necesaria.
+        
+        En ejecuciones normales todo existe ya: una sola lectura del
+        directorio base basta para comprobarlo, y solo se crean los
+        subdirectorios que falten.
+        """
+        try:
+            with os.scandir(self.base_output_dir) as it:
+                existing = {entry.name for entry in it if entry.is_dir()}
+        except FileNotFoundError:
+            existing = set()
+        
+        for subdir in OUTPUT_SUBDIRS:
+            if subdir not in existing:
+                os.makedirs(self.base_output_dir / subdir, exist_ok=True)
+    
+    def generate_unique_filename(self, fractal_type: str, params: Dict[str, Any],
+                                extension: str = "png") -> str:
+        """
+        Genera un nombre de archivo único basado en parámetros.
+        
+        Args:
+            fractal_type: Tipo de fractal (mandelbrot, julia)
+            params: Parámetros del fractal
+            extension: Extensión del archivo
+            
+        Returns:
+            Nombre de archivo único
+        """
+        # Crear hash de parámetros relevantes para evitar duplicados
+        c_str = ""
+        if fractal_type == 'julia' and 'julia_c' in params:
+            c = params['julia_c']
+            c_str = f"_c{c.real:.6f},{c.imag:.6f}"
+        
+        param_str = (f"{fractal_type}_{params.get('width', 800)}x{params.get('height', 600)}"
+                     f"_iter{params.get('max_iter', 100)}"
+                     f"_zoom{params.get('zoom', 1.0):.3f}"
+                     f"_center{params.get('x_center', 0.0):.6f},{params.get('y_center', 0.0):.6f}"
+                     f"{c_str}{'_smooth' if params.get('smooth') else ''}")
+        
+        # Hash corto (4 bytes = 8 caracteres hex) para evitar nombres muy largos
+        param_hash = hashlib.blake2b(param_str.encode(), digest_size=4).hexdigest()
+        
+        # Timestamp para unicidad
+        timestamp = _timestamp(int(time.time()))
+        
+        filename = f"{fractal_type}_{timestamp}_{param_hash}.{extension}"
+        return filename
+    
+    def save_fractal_image(self, fractal_data: np.ndarray, params: Dict[str, Any],
+                          filename: Optional[str] = None, save_metadata: bool = True,
+                          create_thumbnail: bool = True, dpi: int = 150,
+                          png_level: int = 1, use_matplotlib: bool = True) -> str:
+        """
+        Guarda una imagen de fractal con todas las opciones.
+        
+        Args:
+            fractal_data: Matriz de datos del fractal
+            params: Parámetros de generación
+            filename: Nombre personalizado (se genera automáticamente si es None)
+            save_metadata: Si guardar archivo de metadatos
+            create_thumbnail: Si crear miniatura
+            dpi: DPI para la imagen guardada
+            png_level: Nivel de compresión zlib del PNG (0-9, menor = más rápido)
+            use_matplotlib: Si renderizar la figura anotada (título, ejes y barra
+                de colores). Si es False se escribe solo el fractal coloreado
+                con PIL, mucho más rápido
+            
+        Returns:
+            Ruta completa del archivo guardado
+        """
+        # Determinar tipo de fractal
+        fractal_type = "julia" if "julia_c" in params else "mandelbrot"
+        
+        # Generar nombre de archivo si no se proporciona
+        if filename is None:
+            filename = self.generate_unique_filename(fractal_type, params)
+        
+        # Crear ruta completa
+        subdir = self.base_output_dir / fractal_type
+        filepath = subdir / filename
+        
+        # Colorear una sola vez: lo usan la ruta PIL y la miniatura
+        rgba = None
+        if not use_matplotlib or create_thumbnail:
+            # origin='lower' en imshow: la primera fila es la parte imaginaria mínima
+            rgba = colorize(fractal_data[::-1], params.get('colormap', 'hot'),
+                            color_limit(params))
+        
+        if use_matplotlib:
+            self._save_annotated_figure(fractal_data, params, fractal_type, filepath,
+                                        dpi, png_level)
+        else:
+            self._save_colorized(rgba, filepath, png_level)
+        
+        print(f"💾 Imagen guardada: {filepath}")
+        self._stats_cache = None
+        
+        # Guardar metadatos si se solicita
+        if save_metadata:
+            self.save_metadata(filepath, params, fractal_data.shape)
+        
+        # Crear miniatura si se solicita
+        if create_thumbnail:
+            self.create_thumbnail_from_array(rgba, filepath, compress_level=png_level)
+        
+        return str(filepath)
+    
+    def _save_annotated_figure(self, fractal_data: np.ndarray, params: Dict[str, Any],
+                               fractal_type: str, filepath: Path, dpi: int,
+                               png_level: int):
+        """Guarda la imagen con título, ejes y barra de colores vía matplotlib."""
+        # DPI seguro (limitado para no generar imágenes enormes)
+        safe_dpi = min(dpi, 150)
+        
+        # Crear figura sin pasar por pyplot: no toca el estado global, así que
+        # el guardado puede ejecutarse en un hilo de fondo
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        fig = Figure(figsize=(10, 8), dpi=safe_dpi)
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.subplots()
+        
+        # Configurar imagen
+        extent = self._calculate_extent(params)
+        # Normalizar sobre [0, max_iter], igual que la LUT de colorize()
+        im = ax.imshow(fractal_data, extent=extent, cmap=params.get('colormap', 'hot'),
+                      vmin=0, vmax=color_limit(params),
+                      origin='lower', interpolation='nearest')
+        
+        # Configurar título y etiquetas con tamaños de fuente seguros
+        title = self._generate_title(fractal_type, params)
+        ax.set_title(title, fontsize=12, pad=15)
+        ax.set_xlabel('Parte Real', fontsize=10)
+        ax.set_ylabel('Parte Imaginaria', fontsize=10)
+        
+        # Barra de colores
+        cbar = fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+        cbar.set_label(colorbar_label(params), rotation=270, labelpad=15, fontsize=9)
+        
+        # Mejorar apariencia sin tight_layout
+        ax.grid(True, alpha=0.3)
+        
+        # Recorte ajustado medido sin dibujar: bbox_inches='tight' renderiza la
+        # figura completa (remuestreo de la imagen incluido) solo para medirla.
+        # El resultado es idéntico píxel a píxel
+        bbox = fig.get_tightbbox(canvas.get_renderer()).padded(0.1)
+        fig.savefig(str(filepath), dpi=safe_dpi, bbox_inches=bbox,
+                    facecolor='white', edgecolor='none',
+                    pil_kwargs={'compress_level': png_level, 'optimize': False})
+    
+    def _save_colorized(self, rgba: np.ndarray, filepath: Path, png_level: int):
+        """Guarda solo el fractal coloreado, sin figura ni rasterizado de ejes."""
+        from PIL import Image
+        
+        image = Image.fromarray(rgba)
+        
+        if filepath.suffix.lower() in ('.jpg', '.jpeg'):
+            image.convert('RGB').save(filepath, quality=95)
+        else:
+            image.save(filepath, compress_level=png_level)
+    
+    def _calculate_extent(self, params: Dict[str, Any]) -> List[float]:
+        """Calcula la extensión del plano complejo para la imagen."""
+        zoom = params.get('zoom', 1.0)
+        x_center = params.get('x_center', 0.0)
+        y_center = params.get('y_center', 0.0)
+        
+        x_range = 4.0 / zoom
+        y_range = 3.0 / zoom
+        
+        return [
+            x_center - x_range/2,
+            x_center + x_range/2,
+            y_center - y_range/2,
+            y_center + y_range/2
+        ]
+    
+    def _generate_title(self, fractal_type: str, params: Dict[str, Any]) -> str:
+        """Genera título descriptivo para la imagen."""
+        if fractal_type == "julia":
+            c = params.get('julia_c', 0+0j)
+            c_str = f"{c.real:.3f}{'+' if c.imag >= 0 else ''}{c.imag:.3f}i"
+            title = f"Fractal de Julia - c = {c_str}"
+        else:
+            title = f"Fractal de Mandelbrot - Zoom {params.get('zoom', 1.0):.1f}x"
+        
+        title += f"\nCentro: ({params.get('x_center', 0.0):.4f}, {params.get('y_center', 0.0):.4f})"
+        title += f" | Iteraciones: {params.get('max_iter', 100)}"
+        
+        return title
+    
+    def save_metadata(self, image_path: str, params: Dict[str, Any], 
+                     data_shape: Tuple[int, int]):
+        """
+        Guarda metadatos detallados del fractal.
+        
+        Args:
+            image_path: Ruta de la imagen guardada
+            params: Parámetros de generación
+            data_shape: Dimensiones de la matriz de datos
+        """
+        # Preparar metadatos
+        metadata = {
+            'generation_info': {
+                'timestamp': datetime.datetime.now().isoformat(),
+                'image_path': str(image_path),
+                'data_shape': list(data_shape),
+                'total_pixels': data_shape[0] * data_shape[1]
+            },
+            'fractal_parameters': params.copy(),
+            'technical_info': {
+                'algorithm': 'escape_time',
+                'escape_radius': 2.0,
+                'optimization': 'numba_jit'
+            }
+        }
+        
+        # Convertir números complejos a formato serializable
+        if 'julia_c' in metadata['fractal_parameters']:
+            c = metadata['fractal_parameters']['julia_c']
+            metadata['fractal_parameters']['julia_c'] = {
+                'real': float(c.real),
+                'imag': float(c.imag),
+                'string': f"{c.real:.6f}{'+' if c.imag >= 0 else ''}{c.imag:.6f}i"
+            }
+        
+        # Guardar como YAML (más legible)
+        metadata_path = self.base_output_dir / "metadata" / (Path(image_path).stem + "_metadata.yaml")
+        
+        # Versión de libyaml (C) si está disponible; mismo resultado
+        import yaml
+        dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+        
+        with open(metadata_path, 'w', encoding='utf-8') as f:
+            yaml.dump(metadata, f, Dumper=dumper, default_flow_style=False,
+                      allow_unicode=True)
+        
+        print(f"📋 Metadatos guardados: {metadata_path}")
+    
+    def create_thumbnail(self, image_path: str, thumbnail_size: Tuple[int, int] = (200, 150),
+                         compress_level: int = 1):
+        """
+        Crea una miniatura de la imagen.
+        
+        Args:
+            image_path: Ruta de la imagen original
+            thumbnail_size: Tamaño de la miniatura (ancho, alto)
+            compress_level: Nivel de compresión zlib del PNG (0-9)
+        """
+        from PIL import Image
+        
+        try:
+            # Abrir imagen original
+            with Image.open(image_path) as img:
+                # Crear miniatura manteniendo aspecto
+                img.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
+                
+                # Guardar miniatura
+                thumbnail_path = self.base_output_dir / "thumbnails" / (Path(image_path).stem + "_thumb.png")
+                img.save(thumbnail_path, "PNG", compress_level=compress_level)
+                
+                print(f"🖼️  Miniatura creada: {thumbnail_path}")
+                
+        except Exception as e:
+            print(f"❌ Error creando miniatura: {e}")
+    
+    def create_thumbnail_from_array(self, rgba: np.ndarray, image_path: str,
+                                    thumbnail_size: Tuple[int, int] = (200, 150),
+                                    compress_level: int = 1):
+        """
+        Crea la miniatura a partir de la imagen ya coloreada en memoria.
+        
+        Evita volver a abrir y decodificar el PNG recién guardado. Se usa
+        BILINEAR: a 200x150 no se distingue de LANCZOS y es bastante más rápido.
+        
+        Args:
+            rgba: Matriz (alto, ancho, 4) uint8 devuelta por ``colorize``
+            image_path: Ruta de la imagen original (da nombre a la miniatura)
+            thumbnail_size: Tamaño máximo de la miniatura (ancho, alto)
+            compress_level: Nivel de compresión zlib del PNG (0-9)
+        """
+        from PIL import Image
+        
+        try:
+            img = Image.fromarray(rgba)
+            img.thumbnail(thumbnail_size, Image.Resampling.BILINEAR)
+            
+            thumbnail_path = self.base_output_dir / "thumbnails" / (Path(image_path).stem + "_thumb.png")
+            img.save(thumbnail_path, "PNG", compress_level=compress_level)
+            
+            print(f"🖼️  Miniatura creada: {thumbnail_path}")
+            
+        except Exception as e:
+            print(f"❌ Error creando miniatura: {e}")
+    
+    def create_gallery_html(self, output_file: str = None) -> str:
+        """
+        Genera una galería HTML con todas las imágenes.
+        
+        Args:
+            output_file: Nombre del archivo HTML (se genera automáticamente si es None)
+            
+        Returns:
+            Ruta del archivo HTML generado
+        """
+        if output_file is None:
+            timestamp = _timestamp(int(time.time()))
+            output_file = f"fractal_gallery_{timestamp}.html"
+        
+        gallery_path = self.base_output_dir / "gallery" / output_file
+        
+        # Buscar todas las imágenes (una lectura por directorio)
+        image_files = [Path(entry.path) for entry in list_image_entries(
+            self.base_output_dir / subdir for subdir in ["mandelbrot", "julia"]
+        )]
+        
+        # Generar HTML
+        html_content = self._generate_gallery_html(image_files)
+        
+        # Guardar archivo
+        with open(gallery_path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        
+        print(f"🌐 Galería HTML creada: {gallery_path}")
+        print(f"   Imágenes incluidas: {len(image_files)}")
+        
+        return str(gallery_path)
+    
+    def _generate_gallery_html(self, image_files: List[Path]) -> str:
+        """Genera el contenido HTML para la galería."""
+        # Las partes se acumulan en una lista y se unen al final: concatenar
+        # con += copia todo el HTML previo en cada tarjeta
+        parts = ["""
+<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Galería de Arte Fractal</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 0; padding: 20px; background: #f0f0f0; }
+        .header { text-align: center; margin-bottom: 30px; }
+        .gallery { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; }
+        .fractal-card { background: white; border-radius: 10px; padding: 15px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); }
+        .fractal-image { width: 100%; height: auto; border-radius: 5px; cursor: pointer; }
+        .fractal-info { margin-top: 10px; font-size: 14px; color: #666; }
+        .fractal-title { font-weight: bold; color: #333; margin-bottom: 5px; }
+        .modal { display: none; position: fixed; z-index: 1000; left: 0; top: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.9); }
+        .modal-content { margin: auto; display: block; width: 80%; max-width: 1200px; }
+        .close { position: absolute; top: 15px; right: 35px; color: #f1f1f1; font-size: 40px; font-weight: bold; cursor: pointer; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>🎨 Galería de Arte Fractal</h1>
+        <p>Generado el """ + datetime.datetime.now().strftime("%d/%m/%Y a las %H:%M") + """</p>
+    </div>
+    
+    <div class="gallery">
+"""]
+        
+        metadata_dir = self.base_output_dir / "metadata"
+        image_files = sorted(image_files)
+        all_metadata = self._load_metadata_many(
+            [metadata_dir / (img_path.stem + "_metadata.yaml") for img_path in image_files]
+        )
+        
+        # Agregar cada imagen
+        for img_path, metadata in zip(image_files, all_metadata):
+            
+            # Información de la imagen
+            fractal_type = "Julia" if "julia" in img_path.name.lower() else "Mandelbrot"
+            relative_path = os.path.relpath(img_path, self.base_output_dir)
+            
+            params = metadata.get('fractal_parameters', {})
+            zoom = params.get('zoom', 'N/A')
+            iterations = params.get('max_iter', 'N/A')
+            
+            parts.append(f"""
+        <div class="fractal-card">
+            <img class="fractal-image" src="../{relative_path}" alt="{fractal_type} Fractal" onclick="openModal(this.src)">
+            <div class="fractal-title">{fractal_type} Fractal</div>
+            <div class="fractal-info">
+                Zoom: {zoom}x<br>
+                Iteraciones: {iterations}<br>
+                Archivo: {img_path.name}
+            </div>
+        </div>
+""")
+        
+        parts.append("""
+    </div>
+    
+    <!-- Modal para imagen ampliada -->
+    <div id="imageModal" class="modal" onclick="closeModal()">
+        <span class="close">&times;</span>
+        <img class="modal-content" id="modalImage">
+    </div>
+    
+    <script>
+        function openModal(src) {
+            document.getElementById('imageModal').style.display = 'block';
+            document.getElementById('modalImage').src = src;
+        }
+        
+        function closeModal() {
+            document.getElementById('imageModal').style.display = 'none';
+        }
+        
+        document.addEventListener('keydown', function(e) {
+            if (e.key === 'Escape') closeModal();
+        });
+    </script>
+</body>
+</html>
+""")
+        
+        self._save_metadata_cache()
+        return "".join(parts)
+    
+    def _load_metadata_many(self, metadata_paths: List[Path]) -> List[Dict[str, Any]]:
+        """
+        Carga varios archivos de metadatos reutilizando el análisis previo.
+        
+        Los metadatos se escriben una vez y no cambian, así que solo se vuelve
+        a analizar un YAML si su fecha de modificación es distinta de la
+        guardada en caché. Los que faltan se analizan en paralelo cuando son
+        suficientes para compensar el coste del pool de hilos. La caché se
+        reconstruye con las rutas recibidas, así que las entradas de archivos
+        borrados se descartan.
+        
+        Returns:
+            Un diccionario de metadatos por ruta, en el mismo orden (vacío si
+            el archivo no existe o no es válido)
+        """
+        if self._metadata_cache is None:
+            try:
+                with open(self._metadata_cache_path, 'rb') as f:
+                    cache = pickle.load(f)
+            except Exception:
+                cache = None
+            # Un archivo corrupto o de otra versión se descarta como si no existiera
+            self._metadata_cache = cache if isinstance(cache, dict) else {}
+        
+        results: List[Dict[str, Any]] = [{}] * len(metadata_paths)
+        pending = []
+        current = {}
+        
+        for i, metadata_path in enumerate(metadata_paths):
+            try:
+                mtime = os.stat(metadata_path).st_mtime_ns
+            except OSError:
+                continue
+            
+            key = str(metadata_path)
+            cached = self._metadata_cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                results[i] = cached[1]
+                current[key] = cached
+            else:
+                pending.append((i, metadata_path, mtime))
+        
+        if not pending:
+            if len(current) != len(self._metadata_cache):
+                self._metadata_cache = current
+                self._metadata_cache_dirty = True
+            return results
+        
+        paths = [metadata_path for _, metadata_path, _ in pending]
+        if len(pending) >= PARALLEL_METADATA_MIN:
+            with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+                parsed = list(executor.map(_parse_metadata_file, paths))
+        else:
+            parsed = [_parse_metadata_file(path) for path in paths]
+        
+        for (i, metadata_path, mtime), metadata in zip(pending, parsed):
+            results[i] = metadata
+            current[str(metadata_path)] = (mtime, metadata)
+        
+        self._metadata_cache = current
+        self._metadata_cache_dirty = True
+        return results
+    
+    def _save_metadata_cache(self):
+        """Persiste la caché de metadatos si ha cambiado (fallo silencioso)."""
+        if not self._metadata_cache_dirty:
+            return
+        
+        try:
+            with open(self._metadata_cache_path, 'wb') as f:
+                pickle.dump(self._metadata_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._metadata_cache_dirty = False
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _count_files(directory: Path, suffix: str) -> int:
+        """Cuenta los archivos con una extensión dada sin llamar a stat()."""
+        try:
+            with os.scandir(directory) as it:
+                return sum(1 for entry in it if entry.name.endswith(suffix) and entry.is_file())
+        except FileNotFoundError:
+            return 0
+    
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene estadísticas de almacenamiento.
+        
+        El resultado se reutiliza mientras no cambie la fecha de modificación
+        de ninguno de los directorios contados (crear o borrar un archivo la
+        actualiza), así que las llamadas repetidas cuestan cuatro stat().
+        """
+        fingerprint = self._stats_fingerprint()
+        if self._stats_cache is not None and self._stats_cache[0] == fingerprint:
+            return dict(self._stats_cache[1])
+        
+        stats = {
+            'total_images': 0,
+            'mandelbrot_count': 0,
+            'julia_count': 0,
+            'total_size_mb': 0,
+            'thumbnails_count': 0,
+            'metadata_files': 0
+        }
+        
+        # Contar archivos y calcular tamaño en una sola pasada por directorio
+        total_bytes = 0
+        for subdir in ["mandelbrot", "julia"]:
+            count = 0
+            for entry in list_image_entries([self.base_output_dir / subdir]):
+                count += 1
+                total_bytes += entry.stat().st_size
+            
+            stats[f'{subdir}_count'] = count
+            stats['total_images'] += count
+        
+        stats['total_size_mb'] = total_bytes / (1024 * 1024)
+        
+        # Contar miniaturas y metadatos
+        stats['thumbnails_count'] = self._count_files(self.base_output_dir / "thumbnails", ".png")
+        stats['metadata_files'] = self._count_files(self.base_output_dir / "metadata", ".yaml")
+        
+        self._stats_cache = (fingerprint, stats)
+        return dict(stats)
+    
+    def _stats_fingerprint(self) -> Tuple[int, ...]:
+        """Fechas de modificación (ns) de los directorios que cuentan las estadísticas."""
+        fingerprint = []
+        for subdir in ("mandelbrot", "julia", "thumbnails", "metadata"):
+            try:
+                fingerprint.append(os.stat(self.base_output_dir / subdir).st_mtime_ns)
+            except OSError:
+                fingerprint.append(-1)
+        return tuple(fingerprint)
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    # Crear administrador de archivos
+    file_manager = FractalFileManager()
+    
+    # Mostrar estadísticas
+    stats = file_manager.get_storage_stats()
+    print("📊 Estadísticas de almacenamiento:")
+    print(f"   Total de imágenes: {stats['total_images']}")
+    print(f"   Mandelbrot: {stats['mandelbrot_count']}")
+    print(f"   Julia: {stats['julia_count']}")
+    print(f"   Tamaño total: {stats['total_size_mb']:.1f} MB")
+    print(f"   Miniaturas: {stats['thumbnails_count']}")
+    print(f"   Archivos de metadatos: {stats['metadata_files']}")
+    
+    # Crear galería si hay imágenes
+    if stats['total_images'] > 0:
+        gallery_path = file_manager.create_gallery_html()
+        print(f"\n🌐 Galería disponible en: {gallery_path}")
\ No newline at end of file
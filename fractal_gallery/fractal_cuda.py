@@ -0,0 +1,138 @@
+"""
+Kernels CUDA para Mandelbrot y Julia
+====================================
+
+Ruta opcional de cálculo en GPU usando ``numba.cuda``. Cada hilo CUDA
+calcula un píxel; los bloques son de 16x16 hilos y la rejilla cubre
+la imagen completa. Los kernels usan ``cache=True``, igual que los de CPU,
+para no recompilar el PTX en cada proceso.
+
+Este módulo solo se importa cuando se solicita ``device='cuda'`` o cuando
+``device='auto'`` recibe una imagen grande, de modo que el resto del
+programa no depende de tener una GPU o el toolkit CUDA.
+"""
+
+import math
+import numpy as np
+from numba import cuda
+from typing import Tuple
+
+
+THREADS_PER_BLOCK = (16, 16)
+
+
+@cuda.jit(cache=True)
+def mandelbrot_cuda(out, x_min, dx, y_min, dy, max_iter):
+    """Calcula las iteraciones de Mandelbrot para el píxel asignado al hilo."""
+    x, y = cuda.grid(2)
+    height, width = out.shape
+    if x >= width or y >= height:
+        return
+    
+    cr = x_min + x * dx
+    ci = y_min + y * dy
+    zr = 0.0
+    zi = 0.0
+    n = 0
+    while n < max_iter:
+        zr2 = zr * zr
+        zi2 = zi * zi
+        if zr2 + zi2 > 4.0:
+            break
+        zi = 2.0 * zr * zi + ci
+        zr = zr2 - zi2 + cr
+        n += 1
+    out[y, x] = n
+
+
+@cuda.jit(cache=True)
+def julia_cuda(out, x_min, dx, y_min, dy, c_real, c_imag, max_iter):
+    """Calcula las iteraciones de Julia para el píxel asignado al hilo."""
+    x, y = cuda.grid(2)
+    height, width = out.shape
+    if x >= width or y >= height:
+        return
+    
+    zr = x_min + x * dx
+    zi = y_min + y * dy
+    n = 0
+    while n < max_iter:
+        zr2 = zr * zr
+        zi2 = zi * zi
+        if zr2 + zi2 > 4.0:
+            break
+        zi = 2.0 * zr * zi + c_imag
+        zr = zr2 - zi2 + c_real
+        n += 1
+    out[y, x] = n
+
+
+def is_available() -> bool:
+    """Indica si hay una GPU CUDA utilizable."""
+    return cuda.is_available()
+
+
+def _blocks_per_grid(width: int, height: int) -> Tuple[int, int]:
+    """Calcula cuántos bloques hacen falta para cubrir la imagen."""
+    return (math.ceil(width / THREADS_PER_BLOCK[0]),
+            math.ceil(height / THREADS_PER_BLOCK[1]))
+
+
+def _require_cuda():
+    """Lanza un error descriptivo si no hay GPU disponible."""
+    if not cuda.is_available():
+        raise RuntimeError("No hay una GPU CUDA disponible. Use --device cpu")
+
+
+def mandelbrot_set_cuda(width: int, height: int, x_min: float, x_max: float,
+                        y_min: float, y_max: float, max_iter: int,
+                        dtype=np.int32) -> np.ndarray:
+    """
+    Genera el conjunto de Mandelbrot en la GPU.
+    
+    Args:
+        dtype: Tipo entero de la matriz resultado (el que usa la ruta CPU,
+               p. ej. ``iteration_dtype(max_iter)``)
+        
+    Returns:
+        Matriz 2D (en memoria anclada del host) con las iteraciones por píxel
+    """
+    _require_cuda()
+    dx = (x_max - x_min) / width
+    dy = (y_max - y_min) / height
+    
+    d_out = cuda.device_array((height, width), dtype=dtype)
+    mandelbrot_cuda[_blocks_per_grid(width, height), THREADS_PER_BLOCK](
+        d_out, x_min, dx, y_min, dy, max_iter
+    )
+    
+    # Memoria anclada: la copia D2H evita el búfer intermedio paginable
+    result = cuda.pinned_array((height, width), dtype=dtype)
+    d_out.copy_to_host(result)
+    return result
+
+
+def julia_set_cuda(width: int, height: int, x_min: float, x_max: float,
+                   y_min: float, y_max: float, c_real: float, c_imag: float,
+                   max_iter: int, dtype=np.int32) -> np.ndarray:
+    """
+    Genera el conjunto de Julia en la GPU.
+    
+    Args:
+        dtype: Tipo entero de la matriz resultado (como en ``mandelbrot_set_cuda``)
+        
+    Returns:
+        Matriz 2D (en memoria anclada del host) con las iteraciones por píxel
+    """
+    _require_cuda()
+    dx = (x_max - x_min) / width
+    dy = (y_max - y_min) / height
+    
+    d_out = cuda.device_array((height, width), dtype=dtype)
+    julia_cuda[_blocks_per_grid(width, height), THREADS_PER_BLOCK](
+        d_out, x_min, dx, y_min, dy, c_real, c_imag, max_iter
+    )
+    
+    result = cuda.pinned_array((height, width), dtype=dtype)
+    d_out.copy_to_host(result)
+    return result
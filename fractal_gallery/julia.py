@@ -0,0 +1,532 @@
+"""
+Generador de Fractales de Julia optimizado con Numba
+==================================================
+
+Este módulo implementa un algoritmo eficiente para generar fractales de Julia
+usando compilación JIT para máximo rendimiento.
+
+Los conjuntos de Julia se definen como:
+z_{n+1} = z_n^2 + c
+
+Donde z_0 = coordenada del píxel y c es una constante compleja fija.
+Diferentes valores de c producen fractales únicos y fascinantes.
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+from numba import jit, guvectorize, float64, int64, int32, uint16, uint32, uint8
+from typing import Tuple, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import functools
+import os
+import re
+import time
+
+from .presets import FAMOUS_JULIA_SETS
+from .colors import colormap_lut, color_limit, colorbar_label
+from .mandelbrot import (iteration_dtype, output_dtype, pixel_axes, resolve_device,
+                         smooth_level)
+
+
+@jit(nopython=True, fastmath=True, cache=True)
+def julia_point(z: complex, c: complex, max_iter: int) -> int:
+    """
+    Calcula el número de iteraciones antes de que z escape para un fractal de Julia.
+    
+    Args:
+        z: Punto inicial (coordenada del píxel en el plano complejo)
+        c: Constante compleja que define el conjunto de Julia específico
+        max_iter: Número máximo de iteraciones
+        
+    Returns:
+        Número de iteraciones antes del escape
+    """
+    # Aritmética en dos float64 en lugar de complex: evita la raíz de abs()
+    c_real = c.real
+    c_imag = c.imag
+    zr = z.real
+    zi = z.imag
+    for i in range(max_iter):
+        zr2 = zr * zr
+        zi2 = zi * zi
+        if zr2 + zi2 > 4.0:  # Radio de escape (|z| > 2)
+            return i
+        zi = 2.0 * zr * zi + c_imag
+        zr = zr2 - zi2 + c_real
+    return max_iter
+
+
+@jit(nopython=True, fastmath=True, cache=True, inline='always')
+def _julia_escape(zr: float, zi: float, c_real: float, c_imag: float,
+                  max_iter: int) -> Tuple[int, float]:
+    """
+    Bucle de escape compartido por los kernels de fila de Julia.
+    
+    Returns:
+        Tupla (iteraciones, |z|² en el escape); max_iter si no escapa
+    """
+    n = 0
+    while n < max_iter:
+        zr2 = zr * zr
+        zi2 = zi * zi
+        if zr2 + zi2 > 4.0:  # |z| > 2 sin calcular la raíz
+            return n, zr2 + zi2
+        zi = 2.0 * zr * zi + c_imag
+        zr = zr2 - zi2 + c_real
+        n += 1
+    return max_iter, 0.0
+
+
+@guvectorize([(float64[:], float64, float64, float64, int64, uint16[:]),
+              (float64[:], float64, float64, float64, int64, int32[:])],
+             '(n),(),(),(),()->(n)', target='parallel', nopython=True,
+             fastmath=True, cache=True)
+def julia_row(zr0: np.ndarray, zi0: float, c_real: float, c_imag: float,
+              max_iter: int, out: np.ndarray) -> None:
+    """
+    Calcula una fila del conjunto de Julia (kernel ``guvectorize``).
+    
+    Con ``zr0`` de forma (ancho,) y ``zi0`` de forma (alto,) NumPy difunde
+    el kernel sobre todas las filas, que Numba reparte entre hilos.
+    
+    Args:
+        zr0: Partes reales iniciales de los píxeles de la fila
+        zi0: Parte imaginaria inicial común a toda la fila
+        c_real, c_imag: Partes real e imaginaria de la constante c
+        max_iter: Número máximo de iteraciones
+        out: Fila de salida con las iteraciones hasta el escape (uint16 o int32)
+    """
+    for x in range(zr0.shape[0]):
+        out[x] = _julia_escape(zr0[x], zi0, c_real, c_imag, max_iter)[0]
+
+
+@guvectorize([(float64[:], float64, float64, float64, int64, uint8[:])],
+             '(n),(),(),(),()->(n)', target='parallel', nopython=True,
+             fastmath=True, cache=True)
+def julia_row_smooth(zr0: np.ndarray, zi0: float, c_real: float, c_imag: float,
+                     max_iter: int, out: np.ndarray) -> None:
+    """
+    Como ``julia_row``, pero escribe el nivel de coloreado suave (uint8).
+    """
+    for x in range(zr0.shape[0]):
+        n, r2 = _julia_escape(zr0[x], zi0, c_real, c_imag, max_iter)
+        out[x] = smooth_level(n, r2, max_iter)
+
+
+@guvectorize([(float64[:], float64, float64, float64, int64, uint32[:], uint32[:])],
+             '(n),(),(),(),(),(m)->(n)', target='parallel', nopython=True,
+             fastmath=True, cache=True)
+def julia_row_rgba(zr0: np.ndarray, zi0: float, c_real: float, c_imag: float,
+                   max_iter: int, lut: np.ndarray, out: np.ndarray) -> None:
+    """
+    Calcula una fila de Julia y la colorea en el mismo kernel.
+    
+    En lugar de escribir el número de iteraciones, cada píxel guarda
+    directamente su color RGBA empaquetado, así que la matriz de
+    iteraciones nunca llega a existir en memoria.
+    
+    Args:
+        zr0, zi0, c_real, c_imag, max_iter: Como en ``julia_row``
+        lut: Tabla de colores empaquetada de ``max_iter + 1`` entradas
+        out: Fila de salida con los colores RGBA empaquetados en uint32
+    """
+    for x in range(zr0.shape[0]):
+        out[x] = lut[_julia_escape(zr0[x], zi0, c_real, c_imag, max_iter)[0]]
+
+
+def julia_set(width: int, height: int, x_min: float, x_max: float,
+              y_min: float, y_max: float, c_real: float, c_imag: float,
+              max_iter: int) -> np.ndarray:
+    """
+    Genera la matriz completa del conjunto de Julia.
+    
+    Args:
+        width, height: Dimensiones de la imagen
+        x_min, x_max, y_min, y_max: Límites del plano complejo
+        c_real, c_imag: Partes real e imaginaria de la constante c
+        max_iter: Número máximo de iteraciones
+        
+    Returns:
+        Matriz 2D con los valores de iteración para cada píxel
+    """
+    # Coordenadas complejas iniciales (z_0) de columnas y filas
+    xs, ys = pixel_axes(width, height, x_min, x_max, y_min, y_max)
+    
+    return julia_row(xs, ys, c_real, c_imag, max_iter, dtype=iteration_dtype(max_iter))
+
+
+def julia_set_rgba(width: int, height: int, x_min: float, x_max: float,
+                   y_min: float, y_max: float, c_real: float, c_imag: float,
+                   max_iter: int, colormap: str,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Genera el conjunto de Julia ya coloreado, listo para guardarse con PIL.
+    
+    Args:
+        colormap: Mapa de colores de matplotlib, normalizado sobre [0, max_iter]
+        out: Matriz (alto, ancho) uint32 preasignada (opcional)
+        Otros parámetros como en ``julia_set``
+        
+    Returns:
+        Matriz (alto, ancho, 4) uint8 RGBA con la primera fila arriba
+    """
+    xs, ys = pixel_axes(width, height, x_min, x_max, y_min, y_max)
+    if out is None:
+        out = np.empty((height, width), dtype=np.uint32)
+    
+    # Filas en orden inverso: la imagen empieza por la parte imaginaria máxima
+    julia_row_rgba(xs, ys[::-1], c_real, c_imag, max_iter,
+                   colormap_lut(colormap, max_iter + 1), out)
+    return out.view(np.uint8).reshape(height, width, 4)
+
+
+# Forma habitual "a+bi" / "a-bi" (sin espacios); el resto lo resuelve complex()
+_C_PATTERN = re.compile(r'([+-]?\d+(?:\.\d*)?)([+-]\d+(?:\.\d*)?)[ij]')
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_c(text: str) -> complex:
+    """
+    Convierte una cadena "a+bi" en número complejo.
+    
+    Se memoriza porque en uso interactivo la misma cadena se analiza una y
+    otra vez. Lanza ValueError si el formato no es válido.
+    """
+    text = text.replace(' ', '')
+    match = _C_PATTERN.fullmatch(text)
+    if match:
+        return complex(float(match.group(1)), float(match.group(2)))
+    
+    text = text.replace('i', 'j')
+    try:
+        return complex(text)
+    except ValueError:
+        raise ValueError(f"Formato de c inválido: {text}. "
+                         f"Use formatos como: '0.3+0.5j', 'classic', o tuple (0.3, 0.5)")
+
+
+class JuliaGenerator:
+    """
+    Generador de fractales de Julia con presets y configuraciones avanzadas.
+    """
+    
+    def __init__(self):
+        """Inicializa con parámetros por defecto y presets famosos."""
+        self.default_params = {
+            'width': 800,
+            'height': 600,
+            'max_iter': 100,
+            'x_center': 0.0,
+            'y_center': 0.0,
+            'zoom': 1.0,
+            'colormap': 'plasma'
+        }
+        
+        # Constantes c famosas (copia propia: se pueden añadir presets por instancia)
+        self.famous_julia_sets = dict(FAMOUS_JULIA_SETS)
+    
+    def parse_julia_c(self, c_input: Union[str, complex, Tuple[float, float]]) -> complex:
+        """
+        Convierte diferentes formatos de entrada a número complejo.
+        
+        Args:
+            c_input: Puede ser:
+                - String: "0.3+0.5i", "-0.7-0.27i", "classic", "dragon", etc.
+                - Complex: Número complejo directo
+                - Tuple: (parte_real, parte_imaginaria)
+                
+        Returns:
+            Número complejo correspondiente
+        """
+        if isinstance(c_input, complex):
+            return c_input
+        elif isinstance(c_input, (tuple, list)) and len(c_input) == 2:
+            return complex(c_input[0], c_input[1])
+        elif isinstance(c_input, str):
+            # Verificar si es un preset famoso
+            preset = self.famous_julia_sets.get(c_input.lower())
+            if preset is not None:
+                return preset
+            
+            # Parsear formato "a+bi" o "a-bi"
+            return _parse_c(c_input)
+        else:
+            raise ValueError(f"Tipo de entrada no soportado para c: {type(c_input)}")
+    
+    def calculate_bounds(self, x_center: float, y_center: float, zoom: float,
+                        width: int, height: int) -> Tuple[float, float, float, float]:
+        """Calcula los límites del plano complejo."""
+        aspect_ratio = width / height
+        base_extent = 4.0 / zoom
+        
+        x_extent = base_extent * aspect_ratio / 2
+        y_extent = base_extent / 2
+        
+        return (
+            x_center - x_extent,
+            x_center + x_extent,
+            y_center - y_extent,
+            y_center + y_extent
+        )
+    
+    def generate(self, julia_c: Union[str, complex, Tuple[float, float]] = 'classic',
+                width: int = None, height: int = None, max_iter: int = None,
+                x_center: float = None, y_center: float = None, zoom: float = None,
+                colormap: str = None, verbose: bool = True,
+                device: str = 'cpu', out: Optional[np.ndarray] = None,
+                smooth: bool = False) -> Tuple[np.ndarray, dict]:
+        """
+        Genera un fractal de Julia con los parámetros especificados.
+        
+        Args:
+            julia_c: Constante c del fractal (string preset, complex, o tuple)
+            device: Dispositivo de cálculo ('cpu', 'cuda' o 'auto')
+            out: Matriz (alto, ancho) preasignada donde escribir el resultado
+                 (opcional); su tipo debe ser ``output_dtype(max_iter, smooth)``
+            smooth: Coloreado suave con niveles uint8 (solo CPU)
+            Otros parámetros similares a MandelbrotGenerator
+            
+        Returns:
+            Tupla (matriz_fractal, diccionario_parámetros_usados)
+        """
+        # Preparar parámetros
+        params = self.default_params.copy()
+        if width is not None: params['width'] = width
+        if height is not None: params['height'] = height
+        if max_iter is not None: params['max_iter'] = max_iter
+        if x_center is not None: params['x_center'] = x_center
+        if y_center is not None: params['y_center'] = y_center
+        if zoom is not None: params['zoom'] = zoom
+        if colormap is not None: params['colormap'] = colormap
+        params['smooth'] = smooth
+        
+        # Procesar constante c
+        c = self.parse_julia_c(julia_c)
+        params['julia_c'] = c
+        
+        if verbose:
+            print(f"🌀 Generando Julia {params['width']}x{params['height']}")
+            print(f"   Constante c: {c:.4f}")
+            print(f"   Centro: ({params['x_center']:.3f}, {params['y_center']:.3f})")
+            print(f"   Zoom: {params['zoom']:.2f}x, Iteraciones: {params['max_iter']}")
+        
+        if out is not None and out.shape != (params['height'], params['width']):
+            raise ValueError(f"La matriz out tiene forma {out.shape}, se esperaba "
+                           f"{(params['height'], params['width'])}")
+        dtype = output_dtype(params['max_iter'], smooth)
+        if out is not None and out.dtype != dtype:
+            raise ValueError(f"La matriz out es de tipo {out.dtype}, se esperaba "
+                           f"{np.dtype(dtype)}")
+        
+        # Calcular límites
+        x_min, x_max, y_min, y_max = self.calculate_bounds(
+            params['x_center'], params['y_center'], params['zoom'],
+            params['width'], params['height']
+        )
+        
+        # Cronometrar generación
+        start_time = time.perf_counter()
+        
+        # Generar fractal
+        if smooth and device == 'auto':
+            device = 'cpu'
+        device = resolve_device(device, params['width'], params['height'])
+        if device == 'cuda':
+            if smooth:
+                raise ValueError("El coloreado suave solo está disponible con device='cpu'")
+            from .fractal_cuda import julia_set_cuda
+            fractal_data = julia_set_cuda(
+                params['width'], params['height'],
+                x_min, x_max, y_min, y_max,
+                c.real, c.imag, params['max_iter'], dtype=dtype
+            )
+            if out is not None:
+                out[...] = fractal_data
+                fractal_data = out
+        elif device == 'cpu':
+            # Una llamada al kernel difunde sobre todas las filas
+            xs, ys = pixel_axes(params['width'], params['height'], x_min, x_max, y_min, y_max)
+            if out is None:
+                out = np.empty((params['height'], params['width']), dtype=dtype)
+            fractal_data = out
+            kernel = julia_row_smooth if smooth else julia_row
+            kernel(xs, ys, c.real, c.imag, params['max_iter'], fractal_data,
+                   dtype=fractal_data.dtype)
+        else:
+            raise ValueError(f"Dispositivo no soportado: {device}. Use 'cpu', 'cuda' o 'auto'")
+        
+        elapsed = time.perf_counter() - start_time
+        
+        if verbose:
+            # Un render muy rápido puede medir 0 s con un reloj de poca resolución
+            pixels_per_second = (params['width'] * params['height']) / max(elapsed, 1e-9)
+            print(f"   ✅ Completado en {elapsed:.2f}s ({pixels_per_second:,.0f} píxeles/seg)")
+        
+        return fractal_data, params
+    
+    def plot(self, fractal_data: np.ndarray, params: dict,
+             save_path: Optional[str] = None, show: bool = True,
+             interpolation: str = 'nearest') -> plt.Figure:
+        """
+        Visualiza el fractal de Julia generado.
+        
+        Args:
+            fractal_data: Matriz del fractal
+            params: Parámetros de generación
+            save_path: Ruta de guardado opcional
+            show: Si mostrar en pantalla
+            interpolation: Interpolación de imshow ('nearest' muestra los
+                           píxeles calculados sin suavizarlos)
+            
+        Returns:
+            Figura de matplotlib
+        """
+        fig, ax = plt.subplots(figsize=(12, 9), dpi=100)
+        
+        # Crear imagen
+        extent = [
+            params['x_center'] - 2/params['zoom'],
+            params['x_center'] + 2/params['zoom'],
+            params['y_center'] - 1.5/params['zoom'],
+            params['y_center'] + 1.5/params['zoom']
+        ]
+        
+        im = ax.imshow(fractal_data, extent=extent, cmap=params['colormap'],
+                      vmin=0, vmax=color_limit(params),
+                      origin='lower', interpolation=interpolation)
+        
+        # Título descriptivo
+        c = params['julia_c']
+        c_str = f"{c.real:.3f}{'+' if c.imag >= 0 else ''}{c.imag:.3f}i"
+        ax.set_title(f"Fractal de Julia - c = {c_str}\n"
+                    f"Centro: ({params['x_center']:.3f}, {params['y_center']:.3f}) | "
+                    f"Zoom: {params['zoom']:.1f}x | Iteraciones: {params['max_iter']}", 
+                    fontsize=14, pad=20)
+        
+        ax.set_xlabel('Parte Real', fontsize=12)
+        ax.set_ylabel('Parte Imaginaria', fontsize=12)
+        
+        # Barra de colores
+        cbar = plt.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+        cbar.set_label(colorbar_label(params), rotation=270, labelpad=20)
+        
+        # Mejorar apariencia
+        ax.grid(True, alpha=0.3)
+        plt.tight_layout()
+        
+        # Guardar
+        if save_path:
+            plt.savefig(save_path, dpi=150, bbox_inches='tight',
+                       facecolor='white', edgecolor='none')
+            print(f"💾 Imagen guardada: {save_path}")
+        
+        if show:
+            plt.show()
+        
+        return fig
+    
+    def generate_preset_gallery(self, output_dir: str = "output/julia_gallery/",
+                                max_workers: Optional[int] = None):
+        """
+        Genera una galería con todos los presets famosos de Julia.
+        
+        Cada preset es independiente, así que se reparten entre procesos y los
+        núcleos se dividen entre ellos para los hilos de Numba.
+        
+        Args:
+            output_dir: Directorio donde guardar la galería
+            max_workers: Número de procesos (por defecto, uno por núcleo, sin
+                         superar el número de presets)
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        
+        print(f"🎨 Generando galería de Julia sets en {output_dir}")
+        
+        # Tamaño, límites y colores son comunes: se calculan una sola vez
+        width, height, max_iter = 800, 600, 150
+        bounds = self.calculate_bounds(
+            self.default_params['x_center'], self.default_params['y_center'],
+            self.default_params['zoom'], width, height
+        )
+        view = (width, height, bounds, max_iter, self.default_params['colormap'])
+        tasks = [(name, self.parse_julia_c(c_value), output_dir, view)
+                 for name, c_value in self.famous_julia_sets.items()]
+        cpu_count = os.cpu_count() or 1
+        max_workers = min(max_workers or cpu_count, len(tasks))
+        
+        # Repartir los núcleos entre procesos para no sobresuscribir la CPU
+        threads_per_worker = max(1, cpu_count // max_workers)
+        
+        # 'spawn' evita heredar por fork el estado de hilos de Numba
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                                 initializer=_init_gallery_worker,
+                                 initargs=(threads_per_worker,)) as executor:
+            for name in executor.map(_render_gallery_preset, tasks):
+                print(f"   Generado '{name}'")
+        
+        print(f"✅ Galería completa: {len(self.famous_julia_sets)} fractales generados")
+
+
+# Búfer de salida por proceso, reutilizado entre los presets que procesa
+# cada trabajador de la galería (todos tienen el mismo tamaño)
+_gallery_buffers = {}
+
+
+def _init_gallery_worker(num_threads: int) -> None:
+    """
+    Limita los hilos de Numba de un proceso de la galería.
+    
+    Args:
+        num_threads: Hilos que puede usar el kernel paralelo en este proceso
+    """
+    import numba
+    numba.set_num_threads(min(num_threads, numba.config.NUMBA_NUM_THREADS))
+
+
+def _render_gallery_preset(task: Tuple[str, complex, str, tuple]) -> str:
+    """
+    Genera y guarda un preset de la galería (ejecutado en un proceso hijo).
+    
+    Debe ser una función de módulo para que el pool pueda serializarla.
+    
+    Args:
+        task: Tupla (nombre, constante_c, directorio_salida, vista), donde
+              vista es (ancho, alto, límites, max_iter, colormap) y es la
+              misma para todos los presets
+        
+    Returns:
+        Nombre del preset generado
+    """
+    from PIL import Image
+    
+    name, c, output_dir, (width, height, bounds, max_iter, colormap) = task
+    
+    key = (height, width)
+    if key not in _gallery_buffers:
+        _gallery_buffers[key] = np.empty(key, dtype=np.uint32)
+    
+    # Cálculo y coloreado en un solo kernel; PIL guarda sin pasar por matplotlib
+    rgba = julia_set_rgba(width, height, *bounds, c.real, c.imag, max_iter, colormap,
+                          out=_gallery_buffers[key])
+    
+    save_path = os.path.join(output_dir, f"julia_{name}.png")
+    Image.fromarray(rgba).save(save_path, compress_level=1)
+    
+    return name
+
+
+# Ejemplo de uso directo
+if __name__ == "__main__":
+    # Crear generador
+    generator = JuliaGenerator()
+    
+    # Mostrar presets disponibles
+    print("🌟 Presets disponibles:")
+    for name, c in generator.famous_julia_sets.items():
+        print(f"   {name}: c = {c}")
+    
+    # Generar un Julia clásico
+    fractal, params = generator.generate('classic')
+    generator.plot(fractal, params, save_path="output/julia_classic.png")
\ No newline at end of file
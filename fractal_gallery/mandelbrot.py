@@ -0,0 +1,477 @@
+"""
+Generador de Fractales de Mandelbrot optimizado con Numba
+=======================================================
+
+Este módulo implementa un algoritmo eficiente para generar fractales de Mandelbrot
+usando compilación JIT (Just In Time) con Numba para máximo rendimiento.
+
+El conjunto de Mandelbrot se define como:
+z_{n+1} = z_n^2 + c
+
+Donde z_0 = 0 y c es un número complejo que corresponde a cada pixel de la imagen.
+"""
+
+import math
+import numpy as np
+import matplotlib.pyplot as plt
+from numba import jit, guvectorize, float64, int64, int32, uint16, uint8
+from typing import Tuple, Optional
+import time
+
+from .colors import SMOOTH_LEVELS, color_limit, colorbar_label
+
+
+@jit(nopython=True, fastmath=True, cache=True)
+def mandelbrot_point(c: complex, max_iter: int) -> int:
+    """
+    Calcula el número de iteraciones antes de que z escape para un punto c dado.
+    
+    Args:
+        c: Número complejo que representa el punto en el plano complejo
+        max_iter: Número máximo de iteraciones antes de considerar que el punto está en el conjunto
+        
+    Returns:
+        Número de iteraciones antes del escape (max_iter si no escapa)
+    """
+    # Aritmética en dos float64 en lugar de complex: evita la raíz de abs()
+    c_real = c.real
+    c_imag = c.imag
+    zr = 0.0
+    zi = 0.0
+    for i in range(max_iter):
+        zr2 = zr * zr
+        zi2 = zi * zi
+        if zr2 + zi2 > 4.0:  # Radio de escape estándar (|z| > 2)
+            return i
+        zi = 2.0 * zr * zi + c_imag
+        zr = zr2 - zi2 + c_real
+    return max_iter
+
+
+@jit(nopython=True, fastmath=True, cache=True, inline='always')
+def _mandelbrot_escape(c_real: float, ci: float, max_iter: int) -> Tuple[int, float]:
+    """
+    Bucle de escape compartido por los kernels de fila de Mandelbrot.
+    
+    Returns:
+        Tupla (iteraciones, |z|² en el escape); max_iter si no escapa
+    """
+    ci2 = ci * ci
+    
+    # Puntos dentro de la cardioide principal o del bulbo de periodo 2
+    # nunca escapan: se resuelven sin iterar
+    xq = c_real - 0.25
+    q = xq * xq + ci2
+    if q * (q + xq) < 0.25 * ci2:
+        return max_iter, 0.0
+    if (c_real + 1.0) * (c_real + 1.0) + ci2 < 0.0625:
+        return max_iter, 0.0
+    
+    zr = 0.0
+    zi = 0.0
+    zr_old = 0.0
+    zi_old = 0.0
+    n = 0
+    while n < max_iter:
+        zr2 = zr * zr
+        zi2 = zi * zi
+        if zr2 + zi2 > 4.0:  # |z| > 2 sin calcular la raíz
+            return n, zr2 + zi2
+        zi = 2.0 * zr * zi + ci
+        zr = zr2 - zi2 + c_real
+        n += 1
+        
+        # Detección de periodicidad: si la órbita vuelve exactamente a un
+        # punto ya visitado, es un ciclo y el punto pertenece al conjunto
+        if zr == zr_old and zi == zi_old:
+            return max_iter, 0.0
+        if n % 20 == 0:
+            zr_old = zr
+            zi_old = zi
+    return max_iter, 0.0
+
+
+@jit(nopython=True, fastmath=True, cache=True, inline='always')
+def smooth_level(n: int, r2: float, max_iter: int) -> int:
+    """
+    Cuantiza el número de iteraciones continuo a un nivel de 0 a ``SMOOTH_LEVELS``.
+    
+    Usa mu = n + 1 - log2(log|z|), que solo requiere un logaritmo por
+    píxel (en el escape) y elimina las bandas de color de las iteraciones
+    enteras. Los puntos que no escapan reciben ``SMOOTH_LEVELS``.
+    
+    Args:
+        n: Iteraciones hasta el escape
+        r2: |z|² en el momento del escape
+        max_iter: Número máximo de iteraciones
+    """
+    if n >= max_iter:
+        return SMOOTH_LEVELS
+    mu = n + 1.0 - math.log2(0.5 * math.log(r2))
+    level = mu * (SMOOTH_LEVELS / max_iter)
+    if level < 0.0:
+        return 0
+    if level > SMOOTH_LEVELS - 1:
+        return SMOOTH_LEVELS - 1
+    return int(level)
+
+
+@guvectorize([(float64[:], float64, int64, uint16[:]),
+              (float64[:], float64, int64, int32[:])], '(n),(),()->(n)',
+             target='parallel', nopython=True, fastmath=True, cache=True)
+def mandelbrot_row(cr: np.ndarray, ci: float, max_iter: int, out: np.ndarray) -> None:
+    """
+    Calcula una fila del conjunto de Mandelbrot (kernel ``guvectorize``).
+    
+    Al llamarse con ``cr`` de forma (ancho,) y ``ci`` de forma (alto,),
+    NumPy difunde el kernel sobre todas las filas y Numba las reparte
+    entre hilos, generando la imagen completa en una sola llamada.
+    
+    Args:
+        cr: Partes reales de los píxeles de la fila
+        ci: Parte imaginaria común a toda la fila
+        max_iter: Número máximo de iteraciones por punto
+        out: Fila de salida con las iteraciones hasta el escape (uint16 o int32)
+    """
+    for x in range(cr.shape[0]):
+        out[x] = _mandelbrot_escape(cr[x], ci, max_iter)[0]
+
+
+@guvectorize([(float64[:], float64, int64, uint8[:])], '(n),(),()->(n)',
+             target='parallel', nopython=True, fastmath=True, cache=True)
+def mandelbrot_row_smooth(cr: np.ndarray, ci: float, max_iter: int, out: np.ndarray) -> None:
+    """
+    Como ``mandelbrot_row``, pero escribe el nivel de coloreado suave (uint8).
+    """
+    for x in range(cr.shape[0]):
+        n, r2 = _mandelbrot_escape(cr[x], ci, max_iter)
+        out[x] = smooth_level(n, r2, max_iter)
+
+
+def iteration_dtype(max_iter: int) -> type:
+    """
+    Elige el tipo entero más pequeño capaz de guardar ``max_iter``.
+    
+    Con uint16 la matriz de iteraciones ocupa la mitad que con int32,
+    lo que reduce el tráfico de memoria al colorear y guardar.
+    """
+    return np.uint16 if max_iter <= np.iinfo(np.uint16).max else np.int32
+
+
+def output_dtype(max_iter: int, smooth: bool = False) -> type:
+    """
+    Tipo de la matriz que devuelve ``generate()``.
+    
+    Niveles uint8 con coloreado suave; si no, ``iteration_dtype(max_iter)``.
+    """
+    return np.uint8 if smooth else iteration_dtype(max_iter)
+
+
+def pixel_axes(width: int, height: int, x_min: float, x_max: float,
+               y_min: float, y_max: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula las coordenadas de cada columna (eje real) y fila (eje imaginario).
+    
+    Returns:
+        Tupla (xs, ys) con ``width`` y ``height`` coordenadas respectivamente
+    """
+    dx = (x_max - x_min) / width
+    dy = (y_max - y_min) / height
+    return x_min + np.arange(width) * dx, y_min + np.arange(height) * dy
+
+
+# Por debajo de este número de píxeles el coste de lanzar el kernel y copiar
+# el resultado desde la GPU supera lo que se gana frente a la CPU
+CUDA_AUTO_MIN_PIXELS = 1920 * 1080
+
+
+def resolve_device(device: str, width: int, height: int) -> str:
+    """
+    Traduce ``device='auto'`` al dispositivo concreto que se usará.
+    
+    Con 'auto' se elige 'cuda' solo si la imagen alcanza
+    ``CUDA_AUTO_MIN_PIXELS`` y hay una GPU utilizable; en otro caso 'cpu'.
+    Cualquier otro valor se devuelve sin cambios.
+    
+    Returns:
+        'cpu', 'cuda' o el valor recibido si no era 'auto'
+    """
+    if device != 'auto':
+        return device
+    if width * height < CUDA_AUTO_MIN_PIXELS:
+        return 'cpu'
+    try:
+        from .fractal_cuda import is_available
+    except ImportError:
+        return 'cpu'
+    return 'cuda' if is_available() else 'cpu'
+
+
+def render_rows(xs: np.ndarray, ys: np.ndarray, max_iter: int, out: np.ndarray,
+                kernel=mandelbrot_row) -> np.ndarray:
+    """
+    Rellena ``out`` con el kernel de filas aprovechando la simetría del conjunto.
+    
+    El conjunto de Mandelbrot es simétrico respecto al eje real: la fila de
+    parte imaginaria ``y`` es idéntica a la de ``-y``. Como ``ys`` es una
+    progresión aritmética, si el eje real cae sobre la rejilla la fila ``j``
+    es el reflejo de la fila ``eje - j``; esas filas se copian en lugar de
+    calcularse. En la vista por defecto se calcula solo la mitad de la imagen.
+    
+    Args:
+        xs: Partes reales de las columnas
+        ys: Partes imaginarias de las filas (progresión aritmética)
+        max_iter: Número máximo de iteraciones por punto
+        out: Matriz (alto, ancho) de salida (uint16 o int32)
+        kernel: Kernel de filas (``mandelbrot_row`` o ``mandelbrot_row_smooth``)
+        
+    Returns:
+        La propia matriz ``out``
+    """
+    height = ys.shape[0]
+    axis = None
+    if height > 1:
+        # ys[j] == -ys[axis - j] cuando axis = -2*y_min/dy es entero
+        span = -2.0 * ys[0] / (ys[1] - ys[0])
+        nearest = round(span)
+        if abs(span - nearest) < 1e-6:
+            axis = int(nearest)
+    
+    if axis is None or axis <= 0 or axis // 2 >= height - 1:
+        return kernel(xs, ys, max_iter, out, dtype=out.dtype)
+    
+    # Filas [0, half] y (axis, height) no tienen reflejo ya calculado
+    half = axis // 2
+    kernel(xs, ys[:half + 1], max_iter, out[:half + 1], dtype=out.dtype)
+    if axis + 1 < height:
+        kernel(xs, ys[axis + 1:], max_iter, out[axis + 1:], dtype=out.dtype)
+    
+    # La fila j (half < j <= top) es el reflejo de la fila axis - j
+    top = min(axis, height - 1)
+    out[half + 1:top + 1] = out[axis - top:axis - half][::-1]
+    return out
+
+
+def mandelbrot_set(width: int, height: int, x_min: float, x_max: float, 
+                   y_min: float, y_max: float, max_iter: int) -> np.ndarray:
+    """
+    Genera la matriz completa del conjunto de Mandelbrot.
+    
+    Args:
+        width: Ancho de la imagen en píxeles
+        height: Alto de la imagen en píxeles
+        x_min, x_max: Rango del eje real (X)
+        y_min, y_max: Rango del eje imaginario (Y)
+        max_iter: Número máximo de iteraciones por punto
+        
+    Returns:
+        Matriz 2D con los valores de iteración para cada píxel
+    """
+    xs, ys = pixel_axes(width, height, x_min, x_max, y_min, y_max)
+    out = np.empty((height, width), dtype=iteration_dtype(max_iter))
+    return render_rows(xs, ys, max_iter, out)
+
+
+class MandelbrotGenerator:
+    """
+    Generador de fractales de Mandelbrot con opciones avanzadas de configuración.
+    """
+    
+    def __init__(self):
+        """Inicializa el generador con valores por defecto."""
+        self.default_params = {
+            'width': 800,
+            'height': 600,
+            'max_iter': 100,
+            'x_center': -0.5,
+            'y_center': 0.0,
+            'zoom': 1.0,
+            'colormap': 'hot'
+        }
+    
+    def calculate_bounds(self, x_center: float, y_center: float, zoom: float, 
+                        width: int, height: int) -> Tuple[float, float, float, float]:
+        """
+        Calcula los límites del plano complejo basado en centro, zoom y aspecto.
+        
+        Args:
+            x_center, y_center: Coordenadas del centro
+            zoom: Factor de zoom (mayor = más zoom)
+            width, height: Dimensiones de la imagen
+            
+        Returns:
+            Tupla (x_min, x_max, y_min, y_max)
+        """
+        # Mantener aspecto correcto
+        aspect_ratio = width / height
+        
+        # Calcular extensión base (viewport sin zoom)
+        base_extent = 4.0 / zoom  # El conjunto estándar abarca ~4 unidades
+        
+        x_extent = base_extent * aspect_ratio / 2
+        y_extent = base_extent / 2
+        
+        return (
+            x_center - x_extent,
+            x_center + x_extent,
+            y_center - y_extent,
+            y_center + y_extent
+        )
+    
+    def generate(self, width: int = None, height: int = None, max_iter: int = None,
+                x_center: float = None, y_center: float = None, zoom: float = None,
+                colormap: str = None, verbose: bool = True,
+                device: str = 'cpu', out: Optional[np.ndarray] = None,
+                smooth: bool = False) -> Tuple[np.ndarray, dict]:
+        """
+        Genera un fractal de Mandelbrot con los parámetros especificados.
+        
+        Args:
+            width, height: Resolución de la imagen
+            max_iter: Número máximo de iteraciones
+            x_center, y_center: Centro del fractal
+            zoom: Factor de zoom
+            colormap: Esquema de colores de matplotlib
+            verbose: Si mostrar información de progreso
+            device: Dispositivo de cálculo ('cpu', 'cuda' o 'auto')
+            out: Matriz (alto, ancho) preasignada donde escribir el resultado,
+                 útil para reutilizarla entre generaciones (opcional); su tipo
+                 debe ser ``output_dtype(max_iter, smooth)``
+            smooth: Coloreado suave: devuelve niveles uint8 de 0 a SMOOTH_LEVELS
+                    en lugar de iteraciones enteras (solo CPU)
+            
+        Returns:
+            Tupla (matriz_fractal, diccionario_parámetros_usados)
+        """
+        # Usar valores por defecto si no se especifican
+        params = self.default_params.copy()
+        if width is not None: params['width'] = width
+        if height is not None: params['height'] = height
+        if max_iter is not None: params['max_iter'] = max_iter
+        if x_center is not None: params['x_center'] = x_center
+        if y_center is not None: params['y_center'] = y_center
+        if zoom is not None: params['zoom'] = zoom
+        if colormap is not None: params['colormap'] = colormap
+        params['smooth'] = smooth
+        
+        if verbose:
+            print(f"🎨 Generando Mandelbrot {params['width']}x{params['height']}")
+            print(f"   Centro: ({params['x_center']:.4f}, {params['y_center']:.4f})")
+            print(f"   Zoom: {params['zoom']:.2f}x, Iteraciones: {params['max_iter']}")
+        
+        if out is not None and out.shape != (params['height'], params['width']):
+            raise ValueError(f"La matriz out tiene forma {out.shape}, se esperaba "
+                           f"{(params['height'], params['width'])}")
+        dtype = output_dtype(params['max_iter'], smooth)
+        if out is not None and out.dtype != dtype:
+            raise ValueError(f"La matriz out es de tipo {out.dtype}, se esperaba "
+                           f"{np.dtype(dtype)}")
+        
+        # Calcular límites del viewport
+        x_min, x_max, y_min, y_max = self.calculate_bounds(
+            params['x_center'], params['y_center'], params['zoom'],
+            params['width'], params['height']
+        )
+        
+        # Cronometrar la generación
+        start_time = time.perf_counter()
+        
+        # Generar el fractal (aquí es donde Numba acelera dramáticamente)
+        if smooth and device == 'auto':
+            device = 'cpu'
+        device = resolve_device(device, params['width'], params['height'])
+        if device == 'cuda':
+            if smooth:
+                raise ValueError("El coloreado suave solo está disponible con device='cpu'")
+            from .fractal_cuda import mandelbrot_set_cuda
+            fractal_data = mandelbrot_set_cuda(
+                params['width'], params['height'],
+                x_min, x_max, y_min, y_max,
+                params['max_iter'], dtype=dtype
+            )
+            if out is not None:
+                out[...] = fractal_data
+                fractal_data = out
+        elif device == 'cpu':
+            xs, ys = pixel_axes(params['width'], params['height'], x_min, x_max, y_min, y_max)
+            if out is None:
+                out = np.empty((params['height'], params['width']), dtype=dtype)
+            kernel = mandelbrot_row_smooth if smooth else mandelbrot_row
+            fractal_data = render_rows(xs, ys, params['max_iter'], out, kernel)
+        else:
+            raise ValueError(f"Dispositivo no soportado: {device}. Use 'cpu', 'cuda' o 'auto'")
+        
+        elapsed = time.perf_counter() - start_time
+        
+        if verbose:
+            # Un render muy rápido puede medir 0 s con un reloj de poca resolución
+            pixels_per_second = (params['width'] * params['height']) / max(elapsed, 1e-9)
+            print(f"   ✅ Completado en {elapsed:.2f}s ({pixels_per_second:,.0f} píxeles/seg)")
+        
+        return fractal_data, params
+    
+    def plot(self, fractal_data: np.ndarray, params: dict, 
+             save_path: Optional[str] = None, show: bool = True,
+             interpolation: str = 'nearest') -> plt.Figure:
+        """
+        Visualiza el fractal generado con colores y etiquetas.
+        
+        Args:
+            fractal_data: Matriz del fractal generada
+            params: Parámetros usados en la generación
+            save_path: Ruta donde guardar la imagen (opcional)
+            show: Si mostrar la imagen en pantalla
+            interpolation: Interpolación de imshow ('nearest' muestra los
+                           píxeles calculados sin suavizarlos)
+            
+        Returns:
+            Figura de matplotlib
+        """
+        fig, ax = plt.subplots(figsize=(12, 9), dpi=100)
+        
+        # Crear imagen con colormap
+        im = ax.imshow(fractal_data, extent=[
+            params['x_center'] - 2/params['zoom'],
+            params['x_center'] + 2/params['zoom'],
+            params['y_center'] - 1.5/params['zoom'], 
+            params['y_center'] + 1.5/params['zoom']
+        ], cmap=params['colormap'], vmin=0, vmax=color_limit(params),
+           origin='lower', interpolation=interpolation)
+        
+        # Configurar título y etiquetas
+        ax.set_title(f"Fractal de Mandelbrot - Zoom {params['zoom']:.1f}x\n"
+                    f"Centro: ({params['x_center']:.4f}, {params['y_center']:.4f}) | "
+                    f"Iteraciones: {params['max_iter']}", fontsize=14, pad=20)
+        ax.set_xlabel('Parte Real', fontsize=12)
+        ax.set_ylabel('Parte Imaginaria', fontsize=12)
+        
+        # Barra de colores
+        cbar = plt.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+        cbar.set_label(colorbar_label(params), rotation=270, labelpad=20)
+        
+        # Mejorar apariencia
+        ax.grid(True, alpha=0.3)
+        plt.tight_layout()
+        
+        # Guardar si se especifica ruta
+        if save_path:
+            plt.savefig(save_path, dpi=150, bbox_inches='tight', 
+                       facecolor='white', edgecolor='none')
+            print(f"💾 Imagen guardada: {save_path}")
+        
+        if show:
+            plt.show()
+        
+        return fig
+
+
+# Ejemplo de uso directo del módulo
+if __name__ == "__main__":
+    # Crear generador
+    generator = MandelbrotGenerator()
+    
+    # Generar fractal básico
+    fractal, params = generator.generate()
+    
+    # Visualizar
+    generator.plot(fractal, params, save_path="output/mandelbrot_basic.png")
\ No newline at end of file
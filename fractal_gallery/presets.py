@@ -0,0 +1,23 @@
+"""
+Presets de Fractales
+====================
+
+Tablas estáticas de presets. Este módulo no importa numpy, numba ni
+matplotlib, así que comandos como ``info`` pueden listarlos sin pagar la
+carga de los generadores.
+"""
+
+
+# Constantes c famosas que producen fractales de Julia hermosos
+FAMOUS_JULIA_SETS = {
+    'classic': -0.7 + 0.27015j,        # Julia clásico
+    'dragon': -0.8 + 0.156j,           # Parecido a un dragón
+    'spiral': -0.7 - 0.3j,             # Espirales
+    'lightning': -0.54 + 0.54j,        # Rayos/relámpagos
+    'dendrite': -0.235 + 0.85j,        # Estructura dendrítica
+    'rabbit': -0.123 + 0.745j,         # Conejo de Douady
+    'airplane': -0.75 + 0.1j,          # Forma de avión
+    'galaxy': 0.285 + 0.01j,           # Estructura galáctica
+    'flower': -0.4 + 0.6j,             # Pétalos florales
+    'seahorse': -0.75 + 0.11j          # Caballito de mar
+}
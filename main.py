@@ -17,15 +17,102 @@ import sys
 import os
 import click
 import time
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Agregar src al path para importar módulos
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Los módulos de fractal_gallery/ (numpy, matplotlib, numba) se importan dentro de cada
+# comando: así --help, --version o info no pagan su tiempo de carga
 
-from mandelbrot import MandelbrotGenerator
-from julia import JuliaGenerator
-from config_manager import FractalConfig
-from file_utils import FractalFileManager
+
+# Instancias compartidas por proceso: evitan releer la configuración y
+# recrear directorios cada vez que un comando las necesita
+@functools.lru_cache(maxsize=1)
+def _config():
+    """Configuración cargada una sola vez por proceso."""
+    from fractal_gallery.config_manager import FractalConfig
+    return FractalConfig()
+
+
+@functools.lru_cache(maxsize=1)
+def _files():
+    """Administrador de archivos compartido."""
+    from fractal_gallery.file_utils import FractalFileManager
+    return FractalFileManager()
+
+
+@functools.lru_cache(maxsize=1)
+def _julia_generator():
+    """Generador de Julia compartido (sus presets son estáticos)."""
+    from fractal_gallery.julia import JuliaGenerator
+    return JuliaGenerator()
+
+
+@functools.lru_cache(maxsize=1)
+def _io_pool():
+    """Hilos para guardar imágenes mientras el hilo principal sigue trabajando."""
+    return ThreadPoolExecutor(max_workers=2)
+
+
+_THUMB_CACHE_DIR = Path("output") / ".thumb_cache"
+
+# Parámetros que aceptan los métodos generate() de los generadores
+_GEN_KEYS = frozenset(('width', 'height', 'max_iter', 'x_center', 'y_center', 'zoom', 'colormap'))
+
+
+def _merge_overrides(params: dict, **overrides) -> dict:
+    """
+    Combina los parámetros del preset con las opciones de línea de comandos.
+    
+    Las opciones no especificadas (None) no sobrescriben al preset.
+    """
+    return {**params, **{k: v for k, v in overrides.items() if v is not None}}
+
+
+def _load_thumb(path: str, mtime: float, max_dim: int = 400):
+    """
+    Carga una imagen reducida para la cuadrícula usando una caché en disco.
+    
+    Cada imagen tiene una sola entrada (clave: ruta y tamaño máximo) guardada
+    en uint8; si la imagen es más reciente que la entrada, se regenera y se
+    sobrescribe, de modo que la caché no acumula versiones antiguas.
+    
+    Args:
+        path: Ruta de la imagen
+        mtime: Fecha de modificación de la imagen
+        max_dim: Dimensión máxima de la miniatura en píxeles
+        
+    Returns:
+        Array float32 de la imagen submuestreada, con valores en [0, 1]
+    """
+    import numpy as np
+    import matplotlib.image as mpimg
+    
+    key = hashlib.md5(f"{os.path.abspath(path)}|{max_dim}".encode()).hexdigest()
+    cache_file = _THUMB_CACHE_DIR / f"{key}.npy"
+    
+    try:
+        if cache_file.stat().st_mtime >= mtime:
+            return np.load(cache_file).astype(np.float32) / 255
+    except (OSError, ValueError):
+        pass
+    
+    img = mpimg.imread(path)
+    stride = max(1, -(-max(img.shape[:2]) // max_dim))
+    img = img[::stride, ::stride]
+    
+    # PNG se lee como float en [0, 1]; JPEG ya viene en uint8
+    if img.dtype != np.uint8:
+        img = np.rint(img * 255).astype(np.uint8)
+    
+    try:
+        _THUMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        np.save(cache_file, img)
+    except OSError:
+        pass  # Sin caché seguimos funcionando, solo más lento
+    
+    return img.astype(np.float32) / 255
 
 
 @click.group(invoke_without_command=True)
@@ -59,8 +146,11 @@ def cli(ctx, version):
 @click.option('--show/--no-show', default=True, help='Mostrar imagen al completar')
 @click.option('--explore', default=None, help='Punto interesante a explorar (seahorse_valley, spiral, etc.)')
 @click.option('--verbose/--quiet', default=True, help='Mostrar información detallada')
+@click.option('--device', type=click.Choice(['auto', 'cpu', 'cuda']), default='auto', help='Dispositivo de cálculo (auto elige cuda en imágenes grandes si hay GPU)')
+@click.option('--png-level', default=1, type=click.IntRange(0, 9), help='Nivel de compresión PNG (0-9, menor = guardado más rápido)')
+@click.option('--smooth', is_flag=True, help='Coloreado suave sin bandas (solo CPU)')
 def mandelbrot(width, height, iterations, zoom, center_x, center_y, colormap, 
-               preset, output, show, explore, verbose):
+               preset, output, show, explore, verbose, device, png_level, smooth):
     """
     Genera un fractal de Mandelbrot.
     
@@ -71,11 +161,12 @@ def mandelbrot(width, height, iterations, zoom, center_x, center_y, colormap,
         python main.py mandelbrot --preset high
         python main.py mandelbrot --zoom 100 --center-x -0.75 --center-y 0.1
         python main.py mandelbrot --explore seahorse_valley --zoom 50
+        python main.py mandelbrot --preset ultra --device cuda
     """
     try:
         # Cargar configuración
-        config = FractalConfig()
-        file_manager = FractalFileManager()
+        config = _config()
+        file_manager = _files()
         
         # Aplicar preset si se especifica
         params = {}
@@ -84,7 +175,7 @@ def mandelbrot(width, height, iterations, zoom, center_x, center_y, colormap,
                 preset_params = config.get_quality_preset(preset)
                 params.update(preset_params)
                 if verbose:
-                    click.echo(f"✅ Aplicando preset '{preset}': {preset_params}")
+                    click.echo(f"✅ Aplicando preset '{preset}': {dict(preset_params)}")
             except ValueError as e:
                 click.echo(f"❌ Error: {e}", err=True)
                 available_presets = config.list_available_presets()
@@ -105,13 +196,9 @@ def mandelbrot(width, height, iterations, zoom, center_x, center_y, colormap,
                 return
         
         # Aplicar parámetros de línea de comandos (sobrescriben preset)
-        if width is not None: params['width'] = width
-        if height is not None: params['height'] = height
-        if iterations is not None: params['max_iter'] = iterations
-        if zoom is not None: params['zoom'] = zoom
-        if center_x is not None: params['x_center'] = center_x
-        if center_y is not None: params['y_center'] = center_y
-        if colormap is not None: params['colormap'] = colormap
+        params = _merge_overrides(params, width=width, height=height, max_iter=iterations,
+                                  zoom=zoom, x_center=center_x, y_center=center_y,
+                                  colormap=colormap)
         
         # Validar parámetros
         try:
@@ -124,15 +211,17 @@ def mandelbrot(width, height, iterations, zoom, center_x, center_y, colormap,
         if verbose:
             click.echo("🎨 Iniciando generación de Mandelbrot...")
         
-        start_time = time.time()
+        # Importar antes de cronometrar: la carga de numba no es generación
+        from fractal_gallery.mandelbrot import MandelbrotGenerator
         generator = MandelbrotGenerator()
         
         # Filtrar parámetros válidos para el generador
-        generator_params = {k: v for k, v in params.items() 
-                          if k in ['width', 'height', 'max_iter', 'x_center', 'y_center', 'zoom', 'colormap']}
+        generator_params = {k: params[k] for k in _GEN_KEYS & params.keys()}
         
-        fractal_data, final_params = generator.generate(**generator_params, verbose=verbose)
-        generation_time = time.time() - start_time
+        start_time = time.perf_counter()
+        fractal_data, final_params = generator.generate(**generator_params, verbose=verbose,
+                                                       device=device, smooth=smooth)
+        generation_time = time.perf_counter() - start_time
         
         # Guardar imagen
         if output:
@@ -143,20 +232,32 @@ def mandelbrot(width, height, iterations, zoom, center_x, center_y, colormap,
         # Obtener DPI del preset o usar por defecto
         dpi = params.get('dpi', 150)
         
-        save_path = file_manager.save_fractal_image(
-            fractal_data, final_params, filename, 
-            save_metadata=True, create_thumbnail=True, dpi=dpi
+        # Guardar en segundo plano (codificación PNG + disco) mientras se
+        # prepara la figura para mostrar
+        save_future = _io_pool().submit(
+            file_manager.save_fractal_image,
+            fractal_data, final_params, filename,
+            save_metadata=True, create_thumbnail=True, dpi=dpi,
+            png_level=png_level,
+            # Sin ventana no hace falta la figura anotada: PIL escribe directo
+            use_matplotlib=show
         )
         
+        if show:
+            generator.plot(fractal_data, final_params, show=False)
+        
+        save_path = save_future.result()
+        
         # Mostrar estadísticas
         if verbose:
             pixels = final_params['width'] * final_params['height']
-            click.echo(f"⚡ Rendimiento: {pixels/generation_time:,.0f} píxeles/segundo")
+            click.echo(f"⚡ Rendimiento: {pixels/max(generation_time, 1e-9):,.0f} píxeles/segundo")
             click.echo(f"📁 Archivo guardado: {save_path}")
         
         # Mostrar imagen si se solicita
         if show:
-            generator.plot(fractal_data, final_params, show=True)
+            import matplotlib.pyplot as plt
+            plt.show()
         
     except Exception as e:
         click.echo(f"❌ Error inesperado: {e}", err=True)
@@ -179,8 +280,11 @@ def mandelbrot(width, height, iterations, zoom, center_x, center_y, colormap,
 @click.option('--show/--no-show', default=True, help='Mostrar imagen al completar')
 @click.option('--gallery', is_flag=True, help='Generar galería con todos los presets famosos')
 @click.option('--verbose/--quiet', default=True, help='Mostrar información detallada')
+@click.option('--device', type=click.Choice(['auto', 'cpu', 'cuda']), default='auto', help='Dispositivo de cálculo (auto elige cuda en imágenes grandes si hay GPU)')
+@click.option('--png-level', default=1, type=click.IntRange(0, 9), help='Nivel de compresión PNG (0-9, menor = guardado más rápido)')
+@click.option('--smooth', is_flag=True, help='Coloreado suave sin bandas (solo CPU)')
 def julia(julia_c, width, height, iterations, zoom, center_x, center_y, colormap,
-          preset, output, show, gallery, verbose):
+          preset, output, show, gallery, verbose, device, png_level, smooth):
     """
     Genera un fractal de Julia.
     
@@ -195,9 +299,9 @@ def julia(julia_c, width, height, iterations, zoom, center_x, center_y, colormap
     """
     try:
         # Cargar configuración
-        config = FractalConfig()
-        file_manager = FractalFileManager()
-        generator = JuliaGenerator()
+        config = _config()
+        file_manager = _files()
+        generator = _julia_generator()
         
         # Generar galería si se solicita
         if gallery:
@@ -219,19 +323,15 @@ def julia(julia_c, width, height, iterations, zoom, center_x, center_y, colormap
                 preset_params = config.get_quality_preset(preset)
                 params.update(preset_params)
                 if verbose:
-                    click.echo(f"✅ Aplicando preset '{preset}': {preset_params}")
+                    click.echo(f"✅ Aplicando preset '{preset}': {dict(preset_params)}")
             except ValueError as e:
                 click.echo(f"❌ Error: {e}", err=True)
                 return
         
         # Aplicar parámetros de línea de comandos
-        if width is not None: params['width'] = width
-        if height is not None: params['height'] = height
-        if iterations is not None: params['max_iter'] = iterations
-        if zoom is not None: params['zoom'] = zoom
-        if center_x is not None: params['x_center'] = center_x
-        if center_y is not None: params['y_center'] = center_y
-        if colormap is not None: params['colormap'] = colormap
+        params = _merge_overrides(params, width=width, height=height, max_iter=iterations,
+                                  zoom=zoom, x_center=center_x, y_center=center_y,
+                                  colormap=colormap)
         
         # Validar parámetros
         try:
@@ -244,16 +344,16 @@ def julia(julia_c, width, height, iterations, zoom, center_x, center_y, colormap
         if verbose:
             click.echo(f"🌀 Iniciando generación de Julia con c = {julia_c}...")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Filtrar parámetros válidos para el generador
-        generator_params = {k: v for k, v in params.items() 
-                          if k in ['width', 'height', 'max_iter', 'x_center', 'y_center', 'zoom', 'colormap']}
+        generator_params = {k: params[k] for k in _GEN_KEYS & params.keys()}
         
         fractal_data, final_params = generator.generate(
-            julia_c=julia_c, **generator_params, verbose=verbose
+            julia_c=julia_c, **generator_params, verbose=verbose, device=device,
+            smooth=smooth
         )
-        generation_time = time.time() - start_time
+        generation_time = time.perf_counter() - start_time
         
         # Guardar imagen
         if output:
@@ -264,20 +364,32 @@ def julia(julia_c, width, height, iterations, zoom, center_x, center_y, colormap
         # Obtener DPI del preset o usar por defecto
         dpi = params.get('dpi', 150)
         
-        save_path = file_manager.save_fractal_image(
+        # Guardar en segundo plano (codificación PNG + disco) mientras se
+        # prepara la figura para mostrar
+        save_future = _io_pool().submit(
+            file_manager.save_fractal_image,
             fractal_data, final_params, filename,
-            save_metadata=True, create_thumbnail=True, dpi=dpi
+            save_metadata=True, create_thumbnail=True, dpi=dpi,
+            png_level=png_level,
+            # Sin ventana no hace falta la figura anotada: PIL escribe directo
+            use_matplotlib=show
         )
         
+        if show:
+            generator.plot(fractal_data, final_params, show=False)
+        
+        save_path = save_future.result()
+        
         # Mostrar estadísticas
         if verbose:
             pixels = final_params['width'] * final_params['height']
-            click.echo(f"⚡ Rendimiento: {pixels/generation_time:,.0f} píxeles/segundo")
+            click.echo(f"⚡ Rendimiento: {pixels/max(generation_time, 1e-9):,.0f} píxeles/segundo")
             click.echo(f"📁 Archivo guardado: {save_path}")
         
         # Mostrar imagen si se solicita
         if show:
-            generator.plot(fractal_data, final_params, show=True)
+            import matplotlib.pyplot as plt
+            plt.show()
         
     except Exception as e:
         click.echo(f"❌ Error inesperado: {e}", err=True)
@@ -292,8 +404,8 @@ def info():
     Muestra información del sistema y configuración disponible.
     """
     try:
-        config = FractalConfig()
-        file_manager = FractalFileManager()
+        config = _config()
+        file_manager = _files()
         
         click.echo("📊 Información del Generador de Arte Fractal")
         click.echo("=" * 50)
@@ -317,10 +429,10 @@ def info():
         for fractal_type, points in interesting_points.items():
             click.echo(f"   {fractal_type:9}: {', '.join(points)}")
         
-        # Julia presets
-        generator = JuliaGenerator()
+        # Julia presets (tabla estática: no carga numba ni matplotlib)
+        from fractal_gallery.presets import FAMOUS_JULIA_SETS
         click.echo("\n🌀 Presets de Julia:")
-        for name, c_value in generator.famous_julia_sets.items():
+        for name, c_value in FAMOUS_JULIA_SETS.items():
             click.echo(f"   {name:12}: c = {c_value}")
         
         # Estadísticas de archivos
@@ -344,7 +456,7 @@ def gallery(output):
     Genera una galería HTML con todas las imágenes creadas.
     """
     try:
-        file_manager = FractalFileManager()
+        file_manager = _files()
         
         click.echo("🌐 Generando galería HTML...")
         gallery_path = file_manager.create_gallery_html(output)
@@ -381,16 +493,12 @@ def explore(image_path, interactive, figsize):
         import matplotlib.image as mpimg
         from pathlib import Path
         import numpy as np
+        from fractal_gallery.file_utils import list_image_entries
         
         # Si no se especifica imagen, buscar la más reciente
         if not image_path:
             output_dir = Path("output")
-            image_files = []
-            for subdir in ["mandelbrot", "julia"]:
-                subdir_path = output_dir / subdir
-                if subdir_path.exists():
-                    for ext in ["*.png", "*.jpg", "*.jpeg"]:
-                        image_files.extend(subdir_path.glob(ext))
+            image_files = list(list_image_entries(output_dir / subdir for subdir in ["mandelbrot", "julia"]))
             
             if not image_files:
                 click.echo("❌ No se encontraron imágenes. Genera algunas primero:")
@@ -398,11 +506,11 @@ def explore(image_path, interactive, figsize):
                 return
             
             # Usar la más reciente
-            image_path = str(max(image_files, key=lambda p: p.stat().st_mtime))
+            image_path = max(image_files, key=lambda e: e.stat().st_mtime).path
             click.echo(f"📸 Abriendo imagen más reciente: {Path(image_path).name}")
         
-        # Verificar que existe
-        if not Path(image_path).exists():
+        # Verificar que existe la ruta indicada (la más reciente sale del listado)
+        elif not Path(image_path).exists():
             click.echo(f"❌ Archivo no encontrado: {image_path}")
             return
         
@@ -486,13 +594,12 @@ def grid(columns, figsize, fractal_type):
     """
     try:
         import matplotlib.pyplot as plt
-        import matplotlib.image as mpimg
         from pathlib import Path
         import math
+        from fractal_gallery.file_utils import list_image_entries
         
         # Buscar imágenes según el tipo
         output_dir = Path("output")
-        image_files = []
         
         search_dirs = []
         if fractal_type == 'all':
@@ -500,11 +607,7 @@ def grid(columns, figsize, fractal_type):
         else:
             search_dirs = [fractal_type]
         
-        for subdir in search_dirs:
-            subdir_path = output_dir / subdir
-            if subdir_path.exists():
-                for ext in ["*.png", "*.jpg", "*.jpeg"]:
-                    image_files.extend(subdir_path.glob(ext))
+        image_files = list(list_image_entries(output_dir / subdir for subdir in search_dirs))
         
         if not image_files:
             click.echo(f"❌ No se encontraron imágenes de tipo '{fractal_type}'")
@@ -514,7 +617,7 @@ def grid(columns, figsize, fractal_type):
             return
         
         # Ordenar por fecha de modificación (más recientes primero)
-        image_files = sorted(image_files, key=lambda p: p.stat().st_mtime, reverse=True)
+        image_files.sort(key=lambda e: e.stat().st_mtime, reverse=True)
         
         # Calcular disposición de la cuadrícula
         num_images = len(image_files)
@@ -549,7 +652,7 @@ def grid(columns, figsize, fractal_type):
                 continue
                 
             try:
-                img = mpimg.imread(str(img_path))
+                img = _load_thumb(img_path.path, img_path.stat().st_mtime)
                 ax.imshow(img)
                 ax.set_title(img_path.name, fontsize=8, pad=5)
                 ax.axis('off')
@@ -596,13 +699,49 @@ def grid(columns, figsize, fractal_type):
         click.echo(f"❌ Error creando cuadrícula: {e}")
 
 
+@cli.command()
+def precompile():
+    """
+    Compila los kernels de Numba y los guarda en la caché de disco.
+    
+    Basta con ejecutarlo una vez (o tras actualizar): las siguientes
+    ejecuciones cargan el código compilado desde __pycache__.
+    """
+    try:
+        click.echo("⚙️  Compilando kernels de Numba...")
+        start = time.time()
+        
+        # Los gufuncs tienen firmas explícitas: se compilan (o se cargan de
+        # la caché) al importar el módulo
+        from fractal_gallery.mandelbrot import mandelbrot_set
+        from fractal_gallery.julia import julia_set
+        
+        # Ejecutar ambas variantes de salida (uint16 e int32)
+        for max_iter in (10, 70000):
+            mandelbrot_set(2, 2, -2.0, 1.0, -1.0, 1.0, max_iter)
+            julia_set(2, 2, -2.0, 2.0, -1.5, 1.5, -0.7, 0.27015, max_iter)
+        
+        # Los kernels CUDA solo pueden compilarse si hay una GPU disponible
+        from fractal_gallery.mandelbrot import resolve_device
+        if resolve_device('auto', 1920, 1080) == 'cuda':
+            from fractal_gallery.fractal_cuda import mandelbrot_set_cuda, julia_set_cuda
+            mandelbrot_set_cuda(2, 2, -2.0, 1.0, -1.0, 1.0, 10)
+            julia_set_cuda(2, 2, -2.0, 2.0, -1.5, 1.5, -0.7, 0.27015, 10)
+            click.echo("   Kernels CUDA compilados")
+        
+        click.echo(f"✅ Kernels listos en {time.time() - start:.2f}s")
+        
+    except Exception as e:
+        click.echo(f"❌ Error compilando kernels: {e}", err=True)
+
+
 @cli.command()
 def clean():
     """
     Limpia archivos temporales y reorganiza el directorio de salida.
     """
     try:
-        file_manager = FractalFileManager()
+        file_manager = _files()
         
         # Mostrar estadísticas antes
         stats_before = file_manager.get_storage_stats()
@@ -619,9 +758,9 @@ def clean():
 
 if __name__ == "__main__":
     # Verificar que estamos en el directorio correcto
-    if not os.path.exists("src"):
+    if not os.path.exists("fractal_gallery"):
         click.echo("❌ Error: Ejecute este script desde el directorio raíz del proyecto", err=True)
-        click.echo("   (donde se encuentra la carpeta 'src')")
+        click.echo("   (donde se encuentra la carpeta 'fractal_gallery')")
         sys.exit(1)
     
     cli()
\ No newline at end of file